@@ -126,17 +126,28 @@ async def verify_temporal_health(temporal_service: TemporalService = Depends(get
 
 # Google API Service Dependencies
 
-def get_google_auth_manager(settings: Settings = Depends(get_settings)) -> GoogleAuthManager:
+def get_google_auth_manager(
+    settings: Settings = Depends(get_settings)
+) -> Generator[GoogleAuthManager, None, None]:
     """
-    Get Google Auth Manager instance.
+    Get Google Auth Manager instance with proper lifecycle management.
+    
+    The manager's shared HTTP transport is closed once the request is done.
     
     Args:
         settings: Application settings
         
-    Returns:
+    Yields:
         GoogleAuthManager: Auth manager instance
     """
-    return GoogleAuthManager(settings)
+    auth_manager = GoogleAuthManager(settings)
+    try:
+        yield auth_manager
+    finally:
+        try:
+            auth_manager.close()
+        except Exception as e:
+            logger.warning(f"Error closing Google auth manager: {e}")
 
 
 def get_google_drive_client(
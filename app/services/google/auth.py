@@ -8,14 +8,17 @@ Integrates with the existing configuration and dependency injection patterns.
 import json
 import os
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from pydantic import BaseModel
 
 from app.core.config import Settings
@@ -23,6 +26,9 @@ from app.core.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# How long a successful authentication check is reused
+_AUTH_CHECK_TTL_SECONDS = 30
+
 
 class GoogleCredentials(BaseModel):
     """Pydantic model for Google credentials."""
@@ -47,6 +53,8 @@ class GoogleAuthManager:
         """Initialize the Google Auth Manager."""
         self.settings = settings
         self.credentials: Optional[Credentials] = None
+        self._authorized_http: Optional[AuthorizedHttp] = None
+        self._authenticated_check: Optional[Tuple[float, Credentials]] = None
         self._validate_configuration()
     
     def _validate_configuration(self) -> None:
@@ -249,6 +257,49 @@ class GoogleAuthManager:
         
         return self.credentials
     
+    def get_authorized_http(self) -> Optional[AuthorizedHttp]:
+        """
+        Get the shared authorized HTTP transport for Google API services.
+        
+        Sheets and Drive clients built on this transport reuse its open
+        connections instead of each opening their own per service build.
+        The transport is rebuilt whenever the underlying credentials change.
+        
+        Returns:
+            AuthorizedHttp bound to the current credentials, or None if not available
+        """
+        credentials = self.get_valid_credentials()
+        if not credentials:
+            self.close()
+            return None
+        
+        if self._authorized_http is None or self._authorized_http.credentials is not credentials:
+            self.close()
+            self._authorized_http = AuthorizedHttp(credentials, http=build_http())
+        return self._authorized_http
+    
+    def close(self) -> None:
+        """Close the connections of the shared HTTP transport, if one was built."""
+        if self._authorized_http is not None:
+            self._authorized_http.http.close()
+            self._authorized_http = None
+    
+    def create_authorized_http(self) -> Optional[AuthorizedHttp]:
+        """
+        Create a new authorized HTTP transport for use from a worker thread.
+        
+        httplib2 transports are not thread-safe, so requests executed
+        concurrently in threads need their own transport rather than the
+        shared one from get_authorized_http().
+        
+        Returns:
+            New AuthorizedHttp bound to the current credentials, or None if not available
+        """
+        credentials = self.get_valid_credentials()
+        if not credentials:
+            return None
+        return AuthorizedHttp(credentials, http=build_http())
+    
     def revoke_credentials(self) -> bool:
         """
         Revoke current credentials.
@@ -277,9 +328,27 @@ class GoogleAuthManager:
             return False
     
     def is_authenticated(self) -> bool:
-        """Check if user is authenticated with valid credentials."""
+        """
+        Check if user is authenticated with valid credentials.
+        
+        A successful check is reused for up to _AUTH_CHECK_TTL_SECONDS while
+        the same unexpired credentials are held. Replacing or clearing the
+        credentials, as the API clients do when Google rejects them, forces a
+        fresh check. Failed checks are never reused.
+        """
+        checked = self._authenticated_check
+        if (
+            checked is not None
+            and time.monotonic() - checked[0] < _AUTH_CHECK_TTL_SECONDS
+            and self.credentials is checked[1]
+            and not checked[1].expired
+        ):
+            return True
+        
         credentials = self.get_valid_credentials()
-        return credentials is not None and not credentials.expired
+        authenticated = credentials is not None and not credentials.expired
+        self._authenticated_check = (time.monotonic(), credentials) if authenticated else None
+        return authenticated
     
     def get_credentials_info(self) -> Optional[Dict[str, Any]]:
         """Get information about current credentials."""
@@ -73,26 +73,26 @@ class GoogleDriveClient:
         self.close()
     
     def close(self):
-        """Close the service and cleanup resources."""
-        if self._service:
-            try:
-                self._service.close()
-            except Exception as e:
-                logger.warning(f"Error closing Drive service: {e}")
-            finally:
-                self._service = None
+        """
+        Release the service.
+        
+        The HTTP transport is shared through the auth manager and stays open
+        so later clients can reuse its connections; GoogleAuthManager.close()
+        closes it.
+        """
+        self._service = None
     
     @property
     def service(self):
         """Get authenticated Drive service."""
         if not self._service:
-            credentials = self.auth_manager.get_valid_credentials()
-            if not credentials:
+            http = self.auth_manager.get_authorized_http()
+            if not http:
                 raise ValueError("No valid Google credentials available")
             
             self._service = build(
                 'drive', 'v3', 
-                credentials=credentials,
+                http=http,
                 cache_discovery=False  # Recommended for production
             )
         return self._service
@@ -117,7 +117,8 @@ class GoogleDriveClient:
         folder_id: Optional[str] = None,
         file_types: Optional[List[str]] = None,
         limit: int = 100,
-        include_shared: bool = True
+        include_shared: bool = True,
+        http=None
     ) -> List[DriveFile]:
         """
         List files in Drive with optional filtering.
@@ -127,6 +128,7 @@ class GoogleDriveClient:
             file_types: MIME types to filter by
             limit: Maximum number of files to return
             include_shared: Whether to include shared files
+            http: Optional transport to execute the request on instead of the service's own
             
         Returns:
             List of Drive files
@@ -156,7 +158,7 @@ class GoogleDriveClient:
                 pageSize=min(limit, 1000),  # Drive API max is 1000
                 fields="nextPageToken, files(id, name, mimeType, size, "
                        "createdTime, modifiedTime, webViewLink, parents, shared)"
-            ).execute()
+            ).execute(http=http)
             
             files = results.get('files', [])
             
@@ -203,42 +205,9 @@ class GoogleDriveClient:
             List of matching Drive files
         """
         try:
-            # Escape query for Drive API
-            escaped_query = query.replace("'", "\\'")
-            search_query = f"name contains '{escaped_query}' and trashed=false"
-            
-            results = self.service.files().list(
-                q=search_query,
-                pageSize=min(limit, 1000),
-                fields="files(id, name, mimeType, size, createdTime, "
-                       "modifiedTime, webViewLink, parents, shared)"
-            ).execute()
-            
-            files = results.get('files', [])
+            results = self._build_search_request(query, limit).execute()
             
-            # Convert to Pydantic models
-            drive_files = []
-            for file_data in files:
-                try:
-                    drive_file = DriveFile(
-                        id=file_data['id'],
-                        name=file_data['name'],
-                        mime_type=file_data['mimeType'],
-                        size=file_data.get('size'),
-                        created_time=datetime.fromisoformat(
-                            file_data['createdTime'].replace('Z', '+00:00')
-                        ),
-                        modified_time=datetime.fromisoformat(
-                            file_data['modifiedTime'].replace('Z', '+00:00')
-                        ),
-                        web_view_link=file_data['webViewLink'],
-                        parents=file_data.get('parents', []),
-                        shared=file_data.get('shared', False)
-                    )
-                    drive_files.append(drive_file)
-                except Exception as e:
-                    logger.warning(f"Failed to parse search result {file_data.get('name', 'unknown')}: {e}")
-                    continue
+            drive_files = self._parse_search_results(results.get('files', []))
             
             logger.info(f"Found {len(drive_files)} files matching '{query}'")
             return drive_files
@@ -250,6 +219,45 @@ class GoogleDriveClient:
             logger.error(f"Unexpected error searching files: {e}")
             raise
     
+    def _build_search_request(self, query: str, limit: int):
+        """Build a files.list request searching file names for the query."""
+        # Escape query for Drive API
+        escaped_query = query.replace("'", "\\'")
+        search_query = f"name contains '{escaped_query}' and trashed=false"
+        
+        return self.service.files().list(
+            q=search_query,
+            pageSize=min(limit, 1000),
+            fields="files(id, name, mimeType, size, createdTime, "
+                   "modifiedTime, webViewLink, parents, shared)"
+        )
+    
+    def _parse_search_results(self, files: List[Dict[str, Any]]) -> List[DriveFile]:
+        """Convert search result entries to DriveFile models, skipping malformed ones."""
+        drive_files = []
+        for file_data in files:
+            try:
+                drive_file = DriveFile(
+                    id=file_data['id'],
+                    name=file_data['name'],
+                    mime_type=file_data['mimeType'],
+                    size=file_data.get('size'),
+                    created_time=datetime.fromisoformat(
+                        file_data['createdTime'].replace('Z', '+00:00')
+                    ),
+                    modified_time=datetime.fromisoformat(
+                        file_data['modifiedTime'].replace('Z', '+00:00')
+                    ),
+                    web_view_link=file_data['webViewLink'],
+                    parents=file_data.get('parents', []),
+                    shared=file_data.get('shared', False)
+                )
+                drive_files.append(drive_file)
+            except Exception as e:
+                logger.warning(f"Failed to parse search result {file_data.get('name', 'unknown')}: {e}")
+                continue
+        return drive_files
+    
     def get_file_metadata(self, file_id: str) -> Optional[DriveFile]:
         """
         Get detailed metadata for a specific file.
@@ -379,7 +387,8 @@ class GoogleDriveClient:
     def find_campaign_files(
         self, 
         campaign_keywords: List[str],
-        folder_id: Optional[str] = None
+        folder_id: Optional[str] = None,
+        http=None
     ) -> List[DriveFile]:
         """
         Find files that might be related to specific campaigns.
@@ -387,19 +396,28 @@ class GoogleDriveClient:
         Args:
             campaign_keywords: Keywords to search for in file names
             folder_id: Optional folder to restrict search to
+            http: Optional transport to execute the batch on instead of the service's own
             
         Returns:
             List of potential campaign files
         """
         all_files = []
         
-        for keyword in campaign_keywords:
-            try:
-                files = self.search_files(keyword, limit=20)
-                all_files.extend(files)
-            except Exception as e:
-                logger.warning(f"Failed to search for keyword '{keyword}': {e}")
-                continue
+        def handle_search(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            keyword = campaign_keywords[int(request_id)]
+            if exception is not None:
+                logger.warning(f"Failed to search for keyword '{keyword}': {exception}")
+                return
+            all_files.extend(self._parse_search_results(response.get('files', [])))
+        
+        try:
+            # Send one search per keyword in a single batch request
+            batch = self.service.new_batch_http_request(callback=handle_search)
+            for index, keyword in enumerate(campaign_keywords):
+                batch.add(self._build_search_request(keyword, limit=20), request_id=str(index))
+            batch.execute(http=http)
+        except Exception as e:
+            logger.warning(f"Batch search for campaign files failed: {e}")
         
         # Remove duplicates by file ID
         unique_files = {file.id: file for file in all_files}
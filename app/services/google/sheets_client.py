@@ -5,8 +5,9 @@ Provides methods for reading and writing campaign data from Google Sheets.
 Follows FastAPI dependency injection patterns and integrates with auth manager.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 from contextlib import contextmanager
 
@@ -27,6 +28,7 @@ class SheetInfo(BaseModel):
     title: str
     url: str
     sheets: List[Dict[str, Any]] = []
+    modified_time: Optional[datetime] = None
 
 
 class SheetData(BaseModel):
@@ -76,26 +78,26 @@ class GoogleSheetsClient:
         self.close()
     
     def close(self):
-        """Close the service and cleanup resources."""
-        if self._service:
-            try:
-                self._service.close()
-            except Exception as e:
-                logger.warning(f"Error closing Sheets service: {e}")
-            finally:
-                self._service = None
+        """
+        Release the service.
+        
+        The HTTP transport is shared through the auth manager and stays open
+        so later clients can reuse its connections; GoogleAuthManager.close()
+        closes it.
+        """
+        self._service = None
     
     @property
     def service(self):
         """Get authenticated Sheets service."""
         if not self._service:
-            credentials = self.auth_manager.get_valid_credentials()
-            if not credentials:
+            http = self.auth_manager.get_authorized_http()
+            if not http:
                 raise ValueError("No valid Google credentials available")
             
             self._service = build(
                 'sheets', 'v4', 
-                credentials=credentials,
+                http=http,
                 cache_discovery=False  # Recommended for production
             )
         return self._service
@@ -115,12 +117,13 @@ class GoogleSheetsClient:
             logger.error(f"Unexpected error during {operation}: {e}")
             raise
     
-    def get_spreadsheet_info(self, spreadsheet_id: str) -> SheetInfo:
+    def get_spreadsheet_info(self, spreadsheet_id: str, http=None) -> SheetInfo:
         """
         Get information about a spreadsheet.
         
         Args:
             spreadsheet_id: Google Sheets spreadsheet ID
+            http: Optional transport to execute the request on instead of the service's own
             
         Returns:
             SheetInfo object with spreadsheet metadata
@@ -128,21 +131,43 @@ class GoogleSheetsClient:
         with self._handle_api_errors("get_spreadsheet_info"):
             spreadsheet = self.service.spreadsheets().get(
                 spreadsheetId=spreadsheet_id
-            ).execute()
+            ).execute(http=http)
             
-            return SheetInfo(
-                spreadsheet_id=spreadsheet_id,
-                title=spreadsheet['properties']['title'],
-                url=spreadsheet['spreadsheetUrl'],
-                sheets=[
-                    {
-                        'sheet_id': sheet['properties']['sheetId'],
-                        'title': sheet['properties']['title'],
-                        'grid_properties': sheet['properties'].get('gridProperties', {})
-                    }
-                    for sheet in spreadsheet.get('sheets', [])
-                ]
-            )
+            return self._to_sheet_info(spreadsheet_id, spreadsheet)
+    
+    def _to_sheet_info(self, spreadsheet_id: str, spreadsheet: Dict[str, Any]) -> SheetInfo:
+        """Convert a spreadsheets.get response to SheetInfo."""
+        return SheetInfo(
+            spreadsheet_id=spreadsheet_id,
+            title=spreadsheet['properties']['title'],
+            url=spreadsheet['spreadsheetUrl'],
+            sheets=[
+                {
+                    'sheet_id': sheet['properties']['sheetId'],
+                    'title': sheet['properties']['title'],
+                    'grid_properties': sheet['properties'].get('gridProperties', {})
+                }
+                for sheet in spreadsheet.get('sheets', [])
+            ]
+        )
+    
+    async def get_spreadsheet_info_async(self, spreadsheet_id: str) -> SheetInfo:
+        """
+        Get information about a spreadsheet without blocking the event loop.
+        
+        The request runs in a worker thread on its own HTTP transport, so
+        several lookups can be in flight at once.
+        
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            
+        Returns:
+            SheetInfo object with spreadsheet metadata
+        """
+        # Build the service on the calling thread so workers don't race to create it
+        self.service
+        http = self.auth_manager.create_authorized_http()
+        return await asyncio.to_thread(self.get_spreadsheet_info, spreadsheet_id, http)
     
     def read_range(
         self, 
@@ -226,7 +251,8 @@ class GoogleSheetsClient:
     def batch_read(
         self, 
         spreadsheet_id: str, 
-        ranges: List[str]
+        ranges: List[str],
+        http=None
     ) -> List[SheetData]:
         """
         Read multiple ranges in a single request.
@@ -234,6 +260,7 @@ class GoogleSheetsClient:
         Args:
             spreadsheet_id: Google Sheets spreadsheet ID
             ranges: List of A1 notation ranges
+            http: Optional transport to execute the request on instead of the service's own
             
         Returns:
             List of SheetData objects for each range
@@ -243,16 +270,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 ranges=ranges,
                 valueRenderOption="FORMATTED_VALUE"
-            ).execute()
+            ).execute(http=http)
             
-            sheet_data_list = []
-            for value_range in result.get('valueRanges', []):
-                sheet_data = SheetData(
-                    range=value_range.get('range', ''),
-                    values=value_range.get('values', []),
-                    major_dimension=value_range.get('majorDimension', 'ROWS')
-                )
-                sheet_data_list.append(sheet_data)
+            sheet_data_list = self._to_sheet_data_list(result)
             
             logger.info(f"Successfully read {len(sheet_data_list)} ranges")
             return sheet_data_list
@@ -264,6 +284,83 @@ class GoogleSheetsClient:
             logger.error(f"Unexpected error in batch read: {e}")
             raise
     
+    def _to_sheet_data_list(self, result: Dict[str, Any]) -> List[SheetData]:
+        """Convert a values.batchGet response to SheetData objects."""
+        return [
+            SheetData(
+                range=value_range.get('range', ''),
+                values=value_range.get('values', []),
+                major_dimension=value_range.get('majorDimension', 'ROWS')
+            )
+            for value_range in result.get('valueRanges', [])
+        ]
+    
+    def batch_read_spreadsheets(
+        self,
+        spreadsheet_ids: List[str],
+        ranges: Union[List[str], Dict[str, List[str]]],
+        info_ids: Optional[List[str]] = None,
+        http=None
+    ) -> Tuple[Dict[str, Union[List[SheetData], Exception]], Dict[str, Union[SheetInfo, Exception]]]:
+        """
+        Read ranges from several spreadsheets in one batch HTTP request.
+        
+        Each spreadsheet's values.batchGet, plus a spreadsheets.get for every
+        ID in info_ids, is sent as one part of a single batch request. A
+        failed part is returned as its exception instead of raising, so one
+        bad spreadsheet doesn't fail the rest.
+        
+        Args:
+            spreadsheet_ids: Spreadsheets to read
+            ranges: A1 notation ranges read from each spreadsheet, or a dict
+                of ranges per spreadsheet ID
+            info_ids: Spreadsheets to also fetch metadata for
+            http: Optional transport to execute the batch on instead of the service's own
+            
+        Returns:
+            Tuple of (SheetData lists, SheetInfo objects), each keyed by spreadsheet ID
+        """
+        values: Dict[str, Union[List[SheetData], Exception]] = {}
+        infos: Dict[str, Union[SheetInfo, Exception]] = {}
+        
+        def handle_response(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            kind, spreadsheet_id = request_id.split(':', 1)
+            if exception is not None:
+                logger.error(f"Sheets API error in batch read of {spreadsheet_id}: {exception}")
+                if isinstance(exception, HttpError) and exception.resp.status in [401, 403]:
+                    # Clear invalid credentials
+                    self.auth_manager.credentials = None
+                result = exception
+            else:
+                try:
+                    if kind == 'info':
+                        result = self._to_sheet_info(spreadsheet_id, response)
+                    else:
+                        result = self._to_sheet_data_list(response)
+                except Exception as e:
+                    result = e
+            (infos if kind == 'info' else values)[spreadsheet_id] = result
+        
+        batch = self.service.new_batch_http_request(callback=handle_response)
+        for spreadsheet_id in info_ids or []:
+            batch.add(
+                self.service.spreadsheets().get(spreadsheetId=spreadsheet_id),
+                request_id=f"info:{spreadsheet_id}"
+            )
+        for spreadsheet_id in spreadsheet_ids:
+            batch.add(
+                self.service.spreadsheets().values().batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=ranges[spreadsheet_id] if isinstance(ranges, dict) else ranges,
+                    valueRenderOption="FORMATTED_VALUE"
+                ),
+                request_id=f"values:{spreadsheet_id}"
+            )
+        batch.execute(http=http)
+        
+        logger.info(f"Successfully batch read {len(values)} spreadsheets")
+        return values, infos
+    
     def batch_write(
         self, 
         spreadsheet_id: str, 
@@ -331,37 +428,13 @@ class GoogleSheetsClient:
             List of CampaignData objects
         """
         try:
-            # Read headers
+            # Read headers and data in a single batchGet round-trip
             header_range = f"{sheet_name}!{header_row}:{header_row}"
-            header_data = self.read_range(spreadsheet_id, header_range)
-            
-            if not header_data.values:
-                logger.warning("No headers found in spreadsheet")
-                return []
-            
-            headers = header_data.values[0]
-            logger.info(f"Found headers: {headers}")
-            
-            # Read all data starting from data_start_row
             data_range = f"{sheet_name}!{data_start_row}:ZZ"
-            data_result = self.read_range(spreadsheet_id, data_range)
-            
-            campaigns = []
-            for row_idx, row in enumerate(data_result.values, start=data_start_row):
-                try:
-                    # Ensure row has same length as headers
-                    padded_row = row + [''] * (len(headers) - len(row))
-                    
-                    # Create campaign data
-                    campaign_data = self._parse_campaign_row(headers, padded_row)
-                    campaigns.append(campaign_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse row {row_idx}: {e}")
-                    continue
+            header_data, data_result = self.batch_read(spreadsheet_id, [header_range, data_range])
             
-            logger.info(f"Successfully parsed {len(campaigns)} campaigns")
-            return campaigns
+            headers = header_data.values[0] if header_data.values else []
+            return self.parse_campaign_values(headers, data_result.values, data_start_row)
             
         except HttpError as e:
             logger.error(f"Sheets API error parsing campaign data: {e}")
@@ -370,6 +443,46 @@ class GoogleSheetsClient:
             logger.error(f"Unexpected error parsing campaign data: {e}")
             raise
     
+    def parse_campaign_values(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        data_start_row: int = 2
+    ) -> List[CampaignData]:
+        """
+        Parse campaign data from already-fetched header and data rows.
+        
+        Args:
+            headers: Header row values
+            rows: Data rows following the header row
+            data_start_row: Sheet row number of the first data row (1-indexed)
+            
+        Returns:
+            List of CampaignData objects
+        """
+        if not headers:
+            logger.warning("No headers found in spreadsheet")
+            return []
+        
+        logger.info(f"Found headers: {headers}")
+        
+        campaigns = []
+        for row_idx, row in enumerate(rows, start=data_start_row):
+            try:
+                # Ensure row has same length as headers
+                padded_row = row + [''] * (len(headers) - len(row))
+                
+                # Create campaign data
+                campaign_data = self._parse_campaign_row(headers, padded_row)
+                campaigns.append(campaign_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse row {row_idx}: {e}")
+                continue
+        
+        logger.info(f"Successfully parsed {len(campaigns)} campaigns")
+        return campaigns
+    
     def _parse_campaign_row(self, headers: List[str], row: List[str]) -> CampaignData:
         """Parse a single campaign row based on headers."""
         # Create a mapping of header to value
@@ -426,6 +539,35 @@ class GoogleSheetsClient:
             raw_row=row
         )
     
+    def find_campaign_sheet_files(self, drive_client, http=None) -> List[Any]:
+        """
+        List spreadsheet files whose names suggest campaign data.
+        
+        Args:
+            drive_client: GoogleDriveClient instance for file discovery
+            http: Optional transport to execute the Drive listing on instead of the service's own
+            
+        Returns:
+            List of Drive files for potential campaign sheets
+        """
+        # Search for spreadsheet files with campaign-related keywords
+        campaign_keywords = ['campaign', 'media', 'planning', 'budget', 'ads']
+        
+        # Get Google Sheets MIME type
+        sheets_mime_type = 'application/vnd.google-apps.spreadsheet'
+        
+        sheet_files = drive_client.list_files(
+            file_types=[sheets_mime_type],
+            limit=50,
+            http=http
+        )
+        
+        # Filter for files that might contain campaign data
+        return [
+            sheet_file for sheet_file in sheet_files
+            if any(keyword in sheet_file.name.lower() for keyword in campaign_keywords)
+        ]
+    
     def find_campaign_sheets(self, drive_client) -> List[SheetInfo]:
         """
         Find spreadsheets that might contain campaign data.
@@ -437,32 +579,61 @@ class GoogleSheetsClient:
             List of SheetInfo objects for potential campaign sheets
         """
         try:
-            # Search for spreadsheet files with campaign-related keywords
-            campaign_keywords = ['campaign', 'media', 'planning', 'budget', 'ads']
+            campaign_sheets = []
+            for sheet_file in self.find_campaign_sheet_files(drive_client):
+                try:
+                    sheet_info = self.get_spreadsheet_info(sheet_file.id)
+                    sheet_info.modified_time = sheet_file.modified_time
+                    campaign_sheets.append(sheet_info)
+                except Exception as e:
+                    logger.warning(f"Could not get info for sheet {sheet_file.name}: {e}")
+                    continue
             
-            # Get Google Sheets MIME type
-            sheets_mime_type = 'application/vnd.google-apps.spreadsheet'
+            logger.info(f"Found {len(campaign_sheets)} potential campaign spreadsheets")
+            return campaign_sheets
             
-            sheet_files = drive_client.list_files(
-                file_types=[sheets_mime_type],
-                limit=50
-            )
+        except Exception as e:
+            logger.error(f"Error finding campaign sheets: {e}")
+            return []
+    
+    async def find_campaign_sheets_async(
+        self,
+        drive_client,
+        max_concurrency: int = 10
+    ) -> List[SheetInfo]:
+        """
+        Find spreadsheets that might contain campaign data, fetching sheet info concurrently.
+        
+        Args:
+            drive_client: GoogleDriveClient instance for file discovery
+            max_concurrency: Maximum number of metadata requests in flight
             
-            # Filter for files that might contain campaign data
-            campaign_sheets = []
-            for sheet_file in sheet_files:
-                name_lower = sheet_file.name.lower()
-                if any(keyword in name_lower for keyword in campaign_keywords):
+        Returns:
+            List of SheetInfo objects for potential campaign sheets, in Drive listing order
+        """
+        try:
+            # List the Drive files in a worker thread, on a transport of its own
+            drive_client.service
+            http = drive_client.auth_manager.create_authorized_http()
+            sheet_files = await asyncio.to_thread(self.find_campaign_sheet_files, drive_client, http)
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def fetch_info(sheet_file) -> Optional[SheetInfo]:
+                async with semaphore:
                     try:
-                        sheet_info = self.get_spreadsheet_info(sheet_file.id)
-                        campaign_sheets.append(sheet_info)
+                        sheet_info = await self.get_spreadsheet_info_async(sheet_file.id)
+                        sheet_info.modified_time = sheet_file.modified_time
+                        return sheet_info
                     except Exception as e:
                         logger.warning(f"Could not get info for sheet {sheet_file.name}: {e}")
-                        continue
+                        return None
+            
+            results = await asyncio.gather(*(fetch_info(sheet_file) for sheet_file in sheet_files))
+            campaign_sheets = [sheet_info for sheet_info in results if sheet_info is not None]
             
             logger.info(f"Found {len(campaign_sheets)} potential campaign spreadsheets")
             return campaign_sheets
             
         except Exception as e:
             logger.error(f"Error finding campaign sheets: {e}")
-            return [] 
\ No newline at end of file
+            return []
@@ -6,6 +6,14 @@ including Workspace, Planning, Insights, and Supervisor agents.
 """
 
 from .agent_service import AgentService
-from .workflows.supervisor import SupervisorWorkflow
+
+
+def __getattr__(name):
+    """Import SupervisorWorkflow on first access so the package loads without the graph stack."""
+    if name == "SupervisorWorkflow":
+        from .workflows.supervisor import SupervisorWorkflow
+        return SupervisorWorkflow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["AgentService", "SupervisorWorkflow"] 
\ No newline at end of file
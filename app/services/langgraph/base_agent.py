@@ -5,6 +5,7 @@ Enhanced with advanced state management, error handling, and monitoring
 
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -22,6 +23,25 @@ from .workflows.state_models import AgentRole
 
 logger = logging.getLogger(__name__)
 
+# Distinct model settings whose LLM clients are kept for reuse
+_LLM_CLIENT_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=_LLM_CLIENT_CACHE_SIZE)
+def _get_llm_client(model_name: str, temperature: float, max_tokens: int) -> ChatOpenAI:
+    """
+    Return the shared ChatOpenAI client for these settings, creating it once.
+    
+    Agents with identical model settings reuse one client and its HTTP
+    connection pool; the least recently used settings are dropped once
+    _LLM_CLIENT_CACHE_SIZE are held.
+    """
+    return ChatOpenAI(
+        model_name=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+
 
 class BaseAgent(ABC):
     """Base class for all agents in the multi-agent system with enhanced capabilities."""
@@ -52,11 +72,7 @@ class BaseAgent(ABC):
         self.agent_role = self._get_agent_role()
         
         # Initialize LLM with error handling
-        self.llm = ChatOpenAI(
-            model_name=config.model_name,
-            temperature=config.temperature,
-            max_tokens=config.max_tokens
-        )
+        self.llm = _get_llm_client(config.model_name, config.temperature, config.max_tokens)
         
         # Initialize tools
         self.tools = self._initialize_tools()
@@ -7,16 +7,18 @@ Command pattern execution, and agent communication.
 
 import pytest
 import asyncio
+import uuid
 from datetime import datetime
 from typing import Dict, Any
+from unittest.mock import AsyncMock, MagicMock
 
 from ..workflows.supervisor import SupervisorWorkflow
 from ..workflows.state_models import (
-    CampaignPlanningState, AgentRole, WorkflowStage, AgentTask, TaskStatus
+    CampaignPlanningState, AgentRole, WorkflowStage, AgentTask, TaskStatus, MAX_AGENT_MESSAGES, MAX_AGENT_ERRORS
 )
 from ..workflows.commands import (
     AgentHandoffCommand, DataRequestCommand, TaskAssignmentCommand,
-    ResultDeliveryCommand, WorkflowControlCommand, create_command, CommandType
+    ResultDeliveryCommand, WorkflowControlCommand, CommandBatch, CommandInterface, create_command, CommandType
 )
 
 
@@ -98,6 +100,34 @@ class TestStateGraphTransitions:
         route = workflow._route_from_supervisor(initial_state)
         assert route == "workspace"
     
+    @pytest.mark.asyncio
+    async def test_completion_messages_version_retried_results(self, workflow, initial_state):
+        """Test that a retry leaves the earlier completion message detectably stale."""
+        await workflow._workspace_node(initial_state)
+        await workflow._workspace_node(initial_state)
+        
+        first, retried = [
+            message.additional_kwargs for message in initial_state.messages
+            if message.additional_kwargs.get("agent") == AgentRole.WORKSPACE.value
+        ]
+        current_version = initial_state.agent_result_versions[AgentRole.WORKSPACE]
+        
+        assert first["result_ref"] == retried["result_ref"] == AgentRole.WORKSPACE.value
+        assert (first["result_version"], retried["result_version"]) == (1, 2)
+        assert first["result_version"] != current_version
+        assert retried["result_version"] == current_version
+    
+    @pytest.mark.asyncio
+    async def test_completion_node_includes_final_outputs(self, workflow, initial_state):
+        """Test that the completion node reports the final snapshot."""
+        initial_state.campaign_plan.budget_allocation = {"budget": 10000}
+    
+        results = await workflow._completion_node(initial_state)
+    
+        assert results["workflow_completed"] is True
+        assert results["final_outputs"] == initial_state.final_snapshot()
+        assert initial_state.current_stage == WorkflowStage.COMPLETE
+    
     def test_completion_score_calculation(self, workflow, initial_state):
         """Test workflow completion score calculation."""
         # Initially should be 0
@@ -192,8 +222,8 @@ class TestCommandPatterns:
         assert result["task_assigned"] is True
         assert result["target_agent"] == AgentRole.INSIGHTS.value
         assert len(state.active_tasks) == 1
-        assert state.active_tasks[0].description == "Analyze campaign performance metrics"
-        assert state.active_tasks[0].agent_role == AgentRole.INSIGHTS
+        assert state.active_tasks[result["task_id"]].description == "Analyze campaign performance metrics"
+        assert state.active_tasks_list[0].agent_role == AgentRole.INSIGHTS
     
     @pytest.mark.asyncio
     async def test_result_delivery_command(self, state):
@@ -250,6 +280,33 @@ class TestCommandPatterns:
         assert result["action_successful"] is True
         assert state.current_stage == WorkflowStage.COMPLETE
     
+    @pytest.mark.asyncio
+    async def test_command_batch_coalesces_duplicates(self, state):
+        """Test that batched commands run concurrently with duplicates executed once."""
+        handoffs = [
+            AgentHandoffCommand(
+                target_agent=AgentRole.PLANNING,
+                source_agent=AgentRole.WORKSPACE,
+                handoff_message="Workspace analysis complete"
+            )
+            for _ in range(2)
+        ]
+        assignments = [
+            TaskAssignmentCommand(target_agent=AgentRole.INSIGHTS, task_description="Analyze trends")
+            for _ in range(2)
+        ]
+        batch = CommandBatch(handoffs + assignments)
+        
+        results = await batch.execute_all(state, max_concurrent=2)
+        
+        assert list(results) == [command.command_id for command in batch.commands]
+        assert all(command.status == "completed" for command in batch.commands)
+        assert results[handoffs[1].command_id] == results[handoffs[0].command_id]
+        # The duplicate handoff is coalesced, but every task assignment runs
+        assert state.next_agent == AgentRole.PLANNING
+        assert len(state.agent_messages[AgentRole.PLANNING]) == 1
+        assert len(state.active_tasks) == 2
+    
     def test_command_factory(self):
         """Test command factory function."""
         # Test handoff command creation
@@ -294,6 +351,36 @@ class TestCommandPatterns:
         assert info["has_error"] is False
         assert "command_id" in info
         assert "created_at" in info
+    
+    @pytest.mark.asyncio
+    async def test_command_lifecycle_times(self, state):
+        """Test that execution and completion times are reported once set."""
+        command = WorkflowControlCommand(control_action="pause")
+        
+        info = command.get_command_info()
+        assert info["executed_at"] is None
+        assert info["completed_at"] is None
+        
+        await command.execute(state)
+        
+        info = command.get_command_info()
+        assert command.created_at <= command.executed_at <= command.completed_at
+        assert info["completed_at"] == command.completed_at.isoformat()
+        assert state.execution_context["pause_time"] == command.executed_at.isoformat()
+    
+    def test_command_ids_are_unique_uuid4(self):
+        """Test that generated command IDs are distinct version 4 UUIDs."""
+        commands = [
+            WorkflowControlCommand(control_action="pause")
+            for _ in range(300)
+        ]
+        command_ids = [command.command_id for command in commands]
+        
+        assert len(set(command_ids)) == len(command_ids)
+        for command_id in command_ids:
+            parsed = uuid.UUID(command_id)
+            assert parsed.version == 4
+            assert str(parsed) == command_id
 
 
 class TestStateModel:
@@ -325,6 +412,20 @@ class TestStateModel:
         assert len(state.agent_messages[AgentRole.WORKSPACE]) == 1
         assert state.agent_messages[AgentRole.WORKSPACE][0] == message
     
+    def test_agent_messages_are_bounded(self, state):
+        """Test that each agent keeps only its most recent messages."""
+        from langchain.schema import HumanMessage
+        
+        for index in range(MAX_AGENT_MESSAGES + 5):
+            state.add_agent_message(AgentRole.PLANNING, HumanMessage(content=f"Message {index}"))
+        
+        messages = state.agent_messages[AgentRole.PLANNING]
+        assert len(messages) == MAX_AGENT_MESSAGES
+        assert messages[0].content == "Message 5"
+        assert len(state.agent_messages[AgentRole.INSIGHTS]) == 0
+        assert state.dropped_agent_messages == {AgentRole.PLANNING: 5}
+        assert state.get_workflow_summary()["dropped_messages_count"] == 5
+    
     def test_agent_result_handling(self, state):
         """Test agent result storage."""
         result_data = {"test": "result"}
@@ -340,6 +441,21 @@ class TestStateModel:
         assert len(state.agent_errors[AgentRole.INSIGHTS]) == 1
         assert state.agent_errors[AgentRole.INSIGHTS][0] == error_message
     
+    def test_agent_errors_are_counted_past_the_buffer(self, state):
+        """Test that dropped errors are counted and still flag the workflow."""
+        for index in range(MAX_AGENT_ERRORS + 2):
+            state.add_agent_error(AgentRole.INSIGHTS, f"Error {index}")
+        
+        assert len(state.agent_errors[AgentRole.INSIGHTS]) == MAX_AGENT_ERRORS
+        assert state.dropped_agent_errors == {AgentRole.INSIGHTS: 2}
+        
+        # The error flag doesn't depend on what the buffer still holds
+        state.agent_errors[AgentRole.INSIGHTS].clear()
+        summary = state.get_workflow_summary()
+        assert summary["has_errors"] is True
+        assert summary["error_count"] == MAX_AGENT_ERRORS + 2
+        assert summary["dropped_errors_count"] == 2
+    
     def test_stage_transitions(self, state):
         """Test workflow stage transitions."""
         # Test transition to planning
@@ -365,6 +481,7 @@ class TestStateModel:
         assert len(state.active_tasks) == 0
         assert len(state.completed_tasks) == 1
         assert state.completed_tasks[0].status == TaskStatus.COMPLETED
+        assert state.completed_tasks[0].completed_at == state.last_activity_time
         
         # Add and fail another task
         task2 = AgentTask(
@@ -380,6 +497,23 @@ class TestStateModel:
         assert state.failed_tasks[0].status == TaskStatus.FAILED
         assert state.failed_tasks[0].error == "Test error"
     
+    def test_task_from_dict_validates_input(self):
+        """Test that tasks built from external data are coerced to their field types."""
+        task = AgentTask.from_dict({
+            "id": "external-task",
+            "agent_role": "planning",
+            "description": "Imported task",
+            "status": "in_progress",
+            "created_at": "2024-01-01T00:00:00"
+        })
+        
+        assert task.agent_role == AgentRole.PLANNING
+        assert task.status == TaskStatus.IN_PROGRESS
+        assert task.created_at == datetime(2024, 1, 1)
+        
+        with pytest.raises(ValueError):
+            AgentTask.from_dict({"id": "bad-task", "agent_role": "unknown", "description": "Bad"})
+    
     def test_workflow_summary(self, state):
         """Test workflow summary generation."""
         summary = state.get_workflow_summary()
@@ -392,6 +526,16 @@ class TestStateModel:
         assert summary["has_errors"] is False
         assert "workflow_duration" in summary
         assert "last_activity" in summary
+    
+    def test_final_snapshot(self, state):
+        """Test that final outputs are dumped to plain dicts."""
+        state.campaign_plan.budget_allocation = {"budget": 10000}
+        
+        snapshot = state.final_snapshot()
+        
+        assert set(snapshot) == {"workspace_data", "campaign_plan", "insights_data"}
+        assert snapshot["campaign_plan"]["budget_allocation"] == {"budget": 10000}
+        assert isinstance(snapshot["workspace_data"], dict)
 
 
 # Integration test to verify the complete workflow
@@ -424,4 +568,92 @@ class TestWorkflowIntegration:
         result = await workflow.execute_command(handoff_command, initial_state)
         
         assert result["handoff_successful"] is True
-        assert len(workflow.execution_history) == 1 
\ No newline at end of file
+        assert len(workflow.execution_history) == 1
+        assert workflow.execution_history[0].command_id == handoff_command.command_id
+        assert workflow.execution_history[0].command_type == CommandType.HANDOFF.value
+    
+    @pytest.mark.asyncio
+    async def test_run_batch_async(self):
+        """Test batched workflow execution through the compiled graph."""
+        workflow = SupervisorWorkflow()
+        states = [CampaignPlanningState(), CampaignPlanningState()]
+        final_states = [dict(state) for state in states]
+        workflow.compiled_graph = AsyncMock()
+        workflow.compiled_graph.abatch.return_value = final_states
+        
+        results = await workflow.run_batch_async(
+            states, config={"mode": "test"}, max_concurrency=2, include_summary=True
+        )
+        
+        workflow.compiled_graph.abatch.assert_awaited_once_with(
+            states, config={"max_concurrency": 2}
+        )
+        assert [r["final_state"] for r in results] == final_states
+        assert all(r["workflow_completed"] for r in results)
+        assert all(r["execution_summary"]["error_count"] == 0 for r in results)
+        assert states[0].workflow_config == {"mode": "test"}
+        assert await workflow.run_batch_async([]) == []
+    
+    @pytest.mark.asyncio
+    async def test_queued_handoffs_are_bounded(self):
+        """Test that stateless handoffs queue up to queue_max and drain as a batch."""
+        workflow = SupervisorWorkflow(config={"queue_max": 2})
+        state = CampaignPlanningState()
+        
+        for message in ("first", "second"):
+            queued = await workflow.handoff_to_agent(AgentRole.PLANNING, AgentRole.WORKSPACE, message)
+            assert queued["command_queued"] is True
+        
+        with pytest.raises(asyncio.QueueFull):
+            await workflow.handoff_to_agent(AgentRole.PLANNING, AgentRole.WORKSPACE, "third")
+        
+        assert workflow.get_workflow_status()["commands_in_queue"] == 2
+        
+        results = await workflow.execute_queued_commands(state)
+        
+        assert len(results) == 2
+        assert workflow.get_workflow_status()["commands_in_queue"] == 0
+        assert len(workflow.execution_history) == 2
+    
+    @pytest.mark.asyncio
+    async def test_stream_workflow_yields_node_updates(self):
+        """Test that node updates are yielded as the graph produces them."""
+        workflow = SupervisorWorkflow()
+        updates = [{"workspace_agent": {"workspace_status": "completed"}},
+                   {"planning_agent": {"planning_status": "completed"}}]
+        
+        async def fake_astream(state, stream_mode):
+            for update in updates:
+                yield update
+        
+        workflow.compiled_graph = MagicMock()
+        workflow.compiled_graph.astream.side_effect = fake_astream
+        
+        chunks = [chunk async for chunk in workflow.stream_workflow(config={"mode": "test"})]
+        
+        assert chunks == updates
+        (streamed_state,), kwargs = workflow.compiled_graph.astream.call_args
+        assert isinstance(streamed_state, CampaignPlanningState)
+        assert streamed_state.workflow_config == {"mode": "test"}
+        assert kwargs["stream_mode"] == "updates"
+    
+    @pytest.mark.asyncio
+    async def test_execution_history_is_bounded(self):
+        """Test that execution history keeps only the newest history_max records."""
+        workflow = SupervisorWorkflow(config={"history_max": 2})
+        state = CampaignPlanningState()
+        commands = []
+        for i in range(3):
+            command = MagicMock(spec=CommandInterface)
+            command.command_id = f"command-{i}"
+            command.command_type = CommandType.HANDOFF
+            command.execute = AsyncMock(return_value={"handoff_successful": True})
+            commands.append(command)
+        
+        for command in commands:
+            await workflow.execute_command(command, state)
+        
+        for command in commands:
+            command.execute.assert_awaited_once_with(state)
+        assert [r.command_id for r in workflow.execution_history] == [c.command_id for c in commands[1:]]
+        assert workflow.get_workflow_status()["execution_history_length"] == 2
@@ -5,17 +5,28 @@ Tools for budget optimization, campaign planning, strategy generation, and perfo
 """
 
 import logging
+from bisect import insort
+from collections import defaultdict
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
-import json
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+_milestone_date = itemgetter("date")
+
+
+def _campaign_id(campaign: Dict[str, Any]) -> Any:
+    """Return the campaign's id, falling back to its name, with a single lookup when id is set."""
+    return campaign["id"] if "id" in campaign else campaign.get("name")
+
 
 class BaseTool(ABC):
     """Base class for all planning tools."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def execute(self, *args, **kwargs) -> Dict[str, Any]:
         """Execute the tool."""
@@ -25,6 +36,8 @@ class BaseTool(ABC):
 class BudgetOptimizer(BaseTool):
     """Tool for optimizing budget allocation across channels and campaigns."""
     
+    __slots__ = ("name", "description", "optimization_methods")
+    
     def __init__(self):
         self.name = "budget_optimizer"
         self.description = "Optimizes budget allocation using historical performance data and constraints"
@@ -99,8 +112,15 @@ class BudgetOptimizer(BaseTool):
         allocation = []
         remaining_budget = total_budget
         
+        # Clamp bounds and base share are loop-invariant
+        base_allocation = total_budget / len(campaigns) if campaigns else 0.0
+        min_budget = constraints["min_budget_per_campaign"]
+        max_budget = constraints["max_budget_per_campaign"]
+        platform_limits = constraints["platform_limits"]
+        _round = round
+        
         for campaign in campaigns:
-            campaign_id = campaign.get("id", campaign.get("name"))
+            campaign_id = _campaign_id(campaign)
             platform = campaign.get("platform", "Unknown")
             
             # Get historical ROAS or default to 2.0
@@ -110,13 +130,10 @@ class BudgetOptimizer(BaseTool):
             performance_score = min(historical_roas / 2.0, 3.0)  # Cap at 3x multiplier
             
             # Base allocation with performance multiplier
-            base_allocation = total_budget / len(campaigns)
             performance_allocation = base_allocation * performance_score
             
             # Apply constraints
-            min_budget = constraints["min_budget_per_campaign"]
-            max_budget = constraints["max_budget_per_campaign"]
-            platform_limit = constraints["platform_limits"].get(platform, total_budget)
+            platform_limit = platform_limits.get(platform, total_budget)
             
             allocated_budget = max(
                 min_budget,
@@ -127,10 +144,10 @@ class BudgetOptimizer(BaseTool):
                 "campaign_id": campaign_id,
                 "campaign_name": campaign.get("name", campaign_id),
                 "platform": platform,
-                "allocated_budget": round(allocated_budget, 2),
-                "performance_score": round(performance_score, 2),
+                "allocated_budget": _round(allocated_budget, 2),
+                "performance_score": _round(performance_score, 2),
                 "historical_roas": historical_roas,
-                "allocation_percentage": round((allocated_budget / total_budget) * 100, 1)
+                "allocation_percentage": _round((allocated_budget / total_budget) * 100, 1)
             })
             
             remaining_budget -= allocated_budget
@@ -154,12 +171,13 @@ class BudgetOptimizer(BaseTool):
         allocation = []
         
         # Group campaigns by platform
-        campaigns_by_platform = {}
+        campaigns_by_platform = defaultdict(list)
         for campaign in campaigns:
-            platform = campaign.get("platform", "Unknown")
-            if platform not in campaigns_by_platform:
-                campaigns_by_platform[platform] = []
-            campaigns_by_platform[platform].append(campaign)
+            campaigns_by_platform[campaign.get("platform", "Unknown")].append(campaign)
+        
+        min_budget = constraints["min_budget_per_campaign"]
+        max_budget = constraints["max_budget_per_campaign"]
+        _round = round
         
         # Allocate budget per platform
         for platform, platform_campaigns in campaigns_by_platform.items():
@@ -168,21 +186,18 @@ class BudgetOptimizer(BaseTool):
             budget_per_campaign = platform_budget / len(platform_campaigns)
             
             for campaign in platform_campaigns:
-                campaign_id = campaign.get("id", campaign.get("name"))
+                campaign_id = _campaign_id(campaign)
                 
                 # Apply constraints
-                min_budget = constraints["min_budget_per_campaign"]
-                max_budget = constraints["max_budget_per_campaign"]
-                
                 allocated_budget = max(min_budget, min(budget_per_campaign, max_budget))
                 
                 allocation.append({
                     "campaign_id": campaign_id,
                     "campaign_name": campaign.get("name", campaign_id),
                     "platform": platform,
-                    "allocated_budget": round(allocated_budget, 2),
+                    "allocated_budget": _round(allocated_budget, 2),
                     "platform_weight": platform_weight,
-                    "allocation_percentage": round((allocated_budget / total_budget) * 100, 1)
+                    "allocation_percentage": _round((allocated_budget / total_budget) * 100, 1)
                 })
         
         return allocation
@@ -253,6 +268,8 @@ class BudgetOptimizer(BaseTool):
 class CampaignPlanner(BaseTool):
     """Tool for developing campaign strategies and timelines."""
     
+    __slots__ = ("name", "description")
+    
     def __init__(self):
         self.name = "campaign_planner"
         self.description = "Creates comprehensive campaign plans with timelines and milestones"
@@ -429,10 +446,11 @@ class CampaignPlanner(BaseTool):
                         "phase": phase["phase"]
                     })
         
-        # Objective-based milestones
+        # Objective-based milestones. Phase and weekly milestones above are
+        # already in date order, so insert in place instead of sorting.
         primary_goal = objectives.get("primary_goal")
         if primary_goal == "lead_generation":
-            milestones.append({
+            insort(milestones, {
                 "milestone": "Lead Generation Target",
                 "date": phases[-1]["end_date"],
                 "success_criteria": [
@@ -441,10 +459,10 @@ class CampaignPlanner(BaseTool):
                     "Lead quality meets requirements"
                 ],
                 "phase": "Campaign Completion"
-            })
+            }, key=_milestone_date)
         
         elif primary_goal == "brand_awareness":
-            milestones.append({
+            insort(milestones, {
                 "milestone": "Brand Awareness Target",
                 "date": phases[-1]["end_date"],
                 "success_criteria": [
@@ -453,9 +471,9 @@ class CampaignPlanner(BaseTool):
                     "Reach target achieved"
                 ],
                 "phase": "Campaign Completion"
-            })
+            }, key=_milestone_date)
         
-        return sorted(milestones, key=lambda x: x["date"])
+        return milestones
     
     async def _define_kpis(self, objectives: Dict[str, Any]) -> Dict[str, Any]:
         """Define KPIs based on campaign objectives."""
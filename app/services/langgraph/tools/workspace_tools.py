@@ -4,10 +4,16 @@ Workspace Tools for LangGraph Multi-Agent System
 Tools for Google Sheets reading, file parsing, data validation, and workspace management.
 """
 
+import asyncio
+import copy
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from abc import ABC, abstractmethod
-import json
 from datetime import datetime
 
 # Add imports for real Google API integration
@@ -18,6 +24,43 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Google Drive file IDs are typically 33-44 characters long and alphanumeric with underscores/hyphens
+_DRIVE_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{28,}$')
+_SHEETS_URL_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+# Spreadsheet metadata cache settings for GoogleSheetsReader
+_SHEET_INFO_CACHE_TTL_SECONDS = 300
+_SHEET_INFO_CACHE_MAX_ENTRIES = 256
+# Spreadsheets per batch request; each contributes a values and a metadata read
+_SHEETS_BATCH_SIZE = 25
+# Validation results kept by WorkspaceManager, keyed by spreadsheet revision
+_VALIDATION_CACHE_MAX_ENTRIES = 256
+
+
+def _campaign_ranges(sheet_range: str, sheet_info) -> List[str]:
+    """
+    Header and data ranges used for campaign parsing on the sheet sheet_range reads.
+    
+    A range without a sheet name reads the spreadsheet's first sheet, so its
+    title is taken from the metadata. Returns an empty list when the sheet
+    can't be resolved.
+    """
+    if '!' in sheet_range:
+        sheet_name = sheet_range.rsplit('!', 1)[0]
+    else:
+        sheets = getattr(sheet_info, "sheets", None)
+        title = sheets[0].get("title") if isinstance(sheets, list) and sheets else None
+        if not title:
+            return []
+        sheet_name = "'" + title.replace("'", "''") + "'"
+    return [f"{sheet_name}!1:1", f"{sheet_name}!2:ZZ"]
+
+
+@lru_cache(maxsize=64)
+def _normalize_platform(platform: str) -> str:
+    """Normalize a platform name for case- and whitespace-insensitive matching."""
+    return platform.strip().lower()
+
 
 class BaseTool(ABC):
     """Base class for all tools."""
@@ -45,6 +88,9 @@ class GoogleSheetsReader(BaseTool):
         self.settings = settings
         self._sheets_client = None
         self._drive_client = None
+        self._sheet_info_cache: Dict[str, Any] = {}
+        self._sheet_info_timestamps: Dict[str, float] = {}
+        self._sheet_info_lock = threading.Lock()
     
     @property
     def sheets_client(self) -> GoogleSheetsClient:
@@ -60,148 +106,431 @@ class GoogleSheetsReader(BaseTool):
             self._drive_client = GoogleDriveClient(self.auth_manager, self.settings)
         return self._drive_client
     
-    async def extract_data(self, spreadsheet_id: str, sheet_range: str = "A1:Z1000") -> Dict[str, Any]:
-        """Extract data from a Google Sheet using real API."""
+    def _get_spreadsheet_info(self, sheets: GoogleSheetsClient, spreadsheet_id: str, http=None):
+        """Get spreadsheet metadata, reusing a recent lookup for the same spreadsheet."""
+        sheet_info = self._get_cached_spreadsheet_info(spreadsheet_id)
+        if sheet_info is not None:
+            return sheet_info
+        
+        sheet_info = sheets.get_spreadsheet_info(spreadsheet_id, http=http)
+        self._cache_spreadsheet_info(spreadsheet_id, sheet_info)
+        return sheet_info
+    
+    def _get_cached_spreadsheet_info(self, spreadsheet_id: str):
+        """Return cached spreadsheet metadata if it is still fresh, else None."""
+        cached_at = self._sheet_info_timestamps.get(spreadsheet_id)
+        if cached_at is not None and time.monotonic() - cached_at < _SHEET_INFO_CACHE_TTL_SECONDS:
+            return self._sheet_info_cache.get(spreadsheet_id)
+        return None
+    
+    def _cache_spreadsheet_info(self, spreadsheet_id: str, sheet_info) -> None:
+        """Store spreadsheet metadata in the cache."""
+        # Lookups run in worker threads, so updates to the cache are serialized
+        with self._sheet_info_lock:
+            # Evict the oldest entry once the cache is full
+            if spreadsheet_id not in self._sheet_info_cache and len(self._sheet_info_cache) >= _SHEET_INFO_CACHE_MAX_ENTRIES:
+                oldest_id = next(iter(self._sheet_info_cache))
+                del self._sheet_info_cache[oldest_id]
+                del self._sheet_info_timestamps[oldest_id]
+            
+            self._sheet_info_cache[spreadsheet_id] = sheet_info
+            self._sheet_info_timestamps[spreadsheet_id] = time.monotonic()
+    
+    def clear_cache(self) -> None:
+        """Clear cached spreadsheet metadata."""
+        with self._sheet_info_lock:
+            self._sheet_info_cache.clear()
+            self._sheet_info_timestamps.clear()
+    
+    async def extract_data(
+        self,
+        spreadsheet_id: str,
+        sheet_range: str = "A1:Z1000",
+        include_raw_rows: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Extract data from a Google Sheet using real API.
+        
+        The blocking Sheets requests run in a worker thread on their own HTTP
+        transport, so concurrent extracts don't hold up the event loop.
+        
+        When include_raw_rows is False the raw grid is left out of the result
+        (row_count is still reported), for callers that only need the parsed
+        campaigns.
+        """
+        timestamp = datetime.utcnow().isoformat()
         try:
-            logger.info(f"Extracting data from sheet {spreadsheet_id}, range {sheet_range}")
+            logger.info("Extracting data from sheet %s, range %s", spreadsheet_id, sheet_range)
             
             # Check authentication first
             if not self.auth_manager.is_authenticated():
                 raise ValueError("Google API authentication required. Please authenticate first.")
             
-            with self.sheets_client as sheets:
-                # Get spreadsheet info
-                sheet_info = sheets.get_spreadsheet_info(spreadsheet_id)
-                logger.info(f"Processing spreadsheet: {sheet_info.title}")
-                
-                # Read the specified range
-                sheet_data = sheets.read_range(spreadsheet_id, sheet_range)
-                
-                if not sheet_data.values:
-                    logger.warning(f"No data found in range {sheet_range}")
-                    return {
-                        "spreadsheet_id": spreadsheet_id,
-                        "range": sheet_range,
-                        "rows": [],
-                        "headers": [],
-                        "extraction_metadata": {
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "row_count": 0,
-                            "column_count": 0,
-                            "status": "no_data_found"
-                        }
-                    }
-                
-                # Extract headers and data rows
-                rows = sheet_data.values
-                headers = rows[0] if rows else []
-                
-                # Parse campaign data using the sheets client's built-in parser
-                try:
-                    campaign_data = sheets.parse_campaign_data(
-                        spreadsheet_id=spreadsheet_id,
-                        sheet_name=sheet_range.split('!')[0] if '!' in sheet_range else "Sheet1"
-                    )
-                    
-                    # Convert CampaignData objects to dictionaries
-                    parsed_campaigns = [
-                        {
-                            "campaign_name": campaign.campaign_name,
-                            "budget": campaign.budget,
-                            "start_date": campaign.start_date,
-                            "end_date": campaign.end_date,
-                            "platform": campaign.platform,
-                            "targeting": campaign.targeting,
-                            "metrics": campaign.metrics,
-                            "raw_row": campaign.raw_row
-                        }
-                        for campaign in campaign_data
-                    ]
-                    
-                    logger.info(f"Successfully parsed {len(parsed_campaigns)} campaigns from spreadsheet")
-                    
-                except Exception as parse_error:
-                    logger.warning(f"Failed to parse campaign data: {parse_error}")
-                    parsed_campaigns = []
-                
-                return {
-                    "spreadsheet_id": spreadsheet_id,
-                    "spreadsheet_title": sheet_info.title,
-                    "spreadsheet_url": sheet_info.url,
-                    "range": sheet_range,
-                    "rows": rows,
-                    "headers": headers,
-                    "parsed_campaigns": parsed_campaigns,
-                    "extraction_metadata": {
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "row_count": len(rows),
-                        "column_count": len(headers),
-                        "campaigns_parsed": len(parsed_campaigns),
-                        "status": "success"
-                    }
-                }
+            # The client is shared by concurrent extracts, so it is not closed
+            # here; each worker thread gets its own transport instead
+            sheets = self.sheets_client
+            # Build the service here so the worker thread doesn't have to
+            sheets.service
+            http = self.auth_manager.create_authorized_http()
+            return await asyncio.to_thread(
+                self._extract_data_sync,
+                sheets,
+                http,
+                spreadsheet_id,
+                sheet_range,
+                include_raw_rows,
+                timestamp
+            )
             
         except ValueError as ve:
-            logger.error(f"Authentication error: {ve}")
+            logger.error("Authentication error: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error extracting Google Sheets data: {e}")
+            logger.error("Error extracting Google Sheets data: %s", e)
             # Return error information instead of raising to allow graceful handling
+            return self._extraction_error(spreadsheet_id, sheet_range, timestamp, e)
+    
+    async def extract_data_batch(
+        self,
+        spreadsheet_ids: List[str],
+        sheet_range: str = "A1:Z1000",
+        include_raw_rows: bool = True,
+        max_concurrency: int = 4
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract data from several Google Sheets with batched API requests.
+        
+        Instead of one round-trip per spreadsheet, the values and metadata
+        reads for up to _SHEETS_BATCH_SIZE spreadsheets go out as a single
+        batch HTTP request. Batches run in worker threads, each on its own
+        transport, with at most max_concurrency in flight.
+        
+        Returns a dict mapping each spreadsheet ID to the same result
+        extract_data would give for it; a spreadsheet that fails gets an
+        error result without affecting the others.
+        """
+        timestamp = datetime.utcnow().isoformat()
+        spreadsheet_ids = list(dict.fromkeys(spreadsheet_ids))
+        if not spreadsheet_ids:
+            return {}
+        
+        logger.info("Extracting data from %d sheets, range %s", len(spreadsheet_ids), sheet_range)
+        
+        # Check authentication first
+        if not self.auth_manager.is_authenticated():
+            raise ValueError("Google API authentication required. Please authenticate first.")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # The shared client stays open; see extract_data
+        sheets = self.sheets_client
+        # Build the service here so the worker threads don't have to
+        sheets.service
+        
+        async def extract_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    http = self.auth_manager.create_authorized_http()
+                    return await asyncio.to_thread(
+                        self._extract_data_batch_sync,
+                        sheets,
+                        http,
+                        chunk,
+                        sheet_range,
+                        include_raw_rows,
+                        timestamp
+                    )
+                except Exception as e:
+                    logger.error("Error extracting Google Sheets data: %s", e)
+                    return {
+                        spreadsheet_id: self._extraction_error(spreadsheet_id, sheet_range, timestamp, e)
+                        for spreadsheet_id in chunk
+                    }
+        
+        chunk_results = await asyncio.gather(*(
+            extract_chunk(spreadsheet_ids[i:i + _SHEETS_BATCH_SIZE])
+            for i in range(0, len(spreadsheet_ids), _SHEETS_BATCH_SIZE)
+        ))
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        for chunk_result in chunk_results:
+            results.update(chunk_result)
+        return {spreadsheet_id: results[spreadsheet_id] for spreadsheet_id in spreadsheet_ids}
+    
+    def _extract_data_batch_sync(
+        self,
+        sheets: GoogleSheetsClient,
+        http,
+        spreadsheet_ids: List[str],
+        sheet_range: str,
+        include_raw_rows: bool,
+        timestamp: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch and parse several sheets with blocking batch requests.
+        
+        The campaign ranges read with sheet_range depend on each spreadsheet's
+        own sheet titles, so when sheet_range names no sheet, uncached metadata
+        is fetched in a batch of its own first. Spreadsheets whose values read
+        fails are retried with sheet_range alone, since batchGet fails as a
+        whole on a single bad range.
+        """
+        sheet_infos = {}
+        for spreadsheet_id in spreadsheet_ids:
+            sheet_info = self._get_cached_spreadsheet_info(spreadsheet_id)
+            if sheet_info is not None:
+                sheet_infos[spreadsheet_id] = sheet_info
+        info_ids = [spreadsheet_id for spreadsheet_id in spreadsheet_ids if spreadsheet_id not in sheet_infos]
+        
+        if info_ids and '!' not in sheet_range:
+            _, fetched_infos = sheets.batch_read_spreadsheets([], [], info_ids=info_ids, http=http)
+            self._store_fetched_infos(sheet_infos, fetched_infos)
+            info_ids = []
+        
+        value_ids = [
+            spreadsheet_id for spreadsheet_id in spreadsheet_ids
+            if not isinstance(sheet_infos.get(spreadsheet_id), Exception)
+        ]
+        ranges = {
+            spreadsheet_id: [sheet_range, *_campaign_ranges(sheet_range, sheet_infos.get(spreadsheet_id))]
+            for spreadsheet_id in value_ids
+        }
+        values = {}
+        if value_ids or info_ids:
+            values, fetched_infos = sheets.batch_read_spreadsheets(value_ids, ranges, info_ids=info_ids, http=http)
+            self._store_fetched_infos(sheet_infos, fetched_infos)
+        
+        retry_ids = [
+            spreadsheet_id for spreadsheet_id in value_ids
+            if isinstance(values.get(spreadsheet_id), Exception) and len(ranges[spreadsheet_id]) > 1
+        ]
+        if retry_ids:
+            logger.warning("Could not read campaign ranges of %d sheets, reading %s alone", len(retry_ids), sheet_range)
+            retried, _ = sheets.batch_read_spreadsheets(retry_ids, [sheet_range], http=http)
+            values.update(retried)
+        
+        results = {}
+        for spreadsheet_id in spreadsheet_ids:
+            sheet_info = sheet_infos.get(spreadsheet_id)
+            value_ranges = values.get(spreadsheet_id)
+            error = next(
+                (item for item in (sheet_info, value_ranges) if isinstance(item, Exception)),
+                None
+            )
+            if error is None and (sheet_info is None or value_ranges is None):
+                error = RuntimeError("No response received for spreadsheet")
+            if error is not None:
+                logger.error("Error extracting Google Sheets data from %s: %s", spreadsheet_id, error)
+                results[spreadsheet_id] = self._extraction_error(spreadsheet_id, sheet_range, timestamp, error)
+                continue
+            
+            sheet_data, *campaign_data = value_ranges
+            header_data, campaign_rows = campaign_data if campaign_data else (None, None)
+            results[spreadsheet_id] = self._build_extraction_result(
+                sheets,
+                spreadsheet_id,
+                sheet_range,
+                sheet_info,
+                sheet_data,
+                header_data,
+                campaign_rows,
+                include_raw_rows,
+                timestamp
+            )
+        return results
+    
+    def _store_fetched_infos(self, sheet_infos: Dict[str, Any], fetched_infos: Dict[str, Any]) -> None:
+        """Cache successfully fetched spreadsheet metadata and record every result."""
+        for spreadsheet_id, sheet_info in fetched_infos.items():
+            if not isinstance(sheet_info, Exception):
+                self._cache_spreadsheet_info(spreadsheet_id, sheet_info)
+            sheet_infos[spreadsheet_id] = sheet_info
+    
+    def _extract_data_sync(
+        self,
+        sheets: GoogleSheetsClient,
+        http,
+        spreadsheet_id: str,
+        sheet_range: str,
+        include_raw_rows: bool,
+        timestamp: str
+    ) -> Dict[str, Any]:
+        """Fetch and parse sheet data with blocking API calls on the given transport."""
+        # Get spreadsheet info
+        sheet_info = self._get_spreadsheet_info(sheets, spreadsheet_id, http)
+        
+        # Read the specified range together with the header and data
+        # ranges used for campaign parsing in one batchGet round-trip
+        campaign_ranges = _campaign_ranges(sheet_range, sheet_info)
+        header_data = campaign_rows = None
+        try:
+            sheet_data, *campaign_data = sheets.batch_read(
+                spreadsheet_id,
+                [sheet_range, *campaign_ranges],
+                http=http
+            )
+            if campaign_ranges:
+                header_data, campaign_rows = campaign_data
+        except Exception as e:
+            if not campaign_ranges:
+                raise
+            # batchGet fails as a whole on one bad range; campaign parsing is
+            # optional, so fall back to reading the requested range alone
+            logger.warning("Could not read campaign ranges of %s, reading %s alone: %s", spreadsheet_id, sheet_range, e)
+            sheet_data, = sheets.batch_read(spreadsheet_id, [sheet_range], http=http)
+        
+        return self._build_extraction_result(
+            sheets,
+            spreadsheet_id,
+            sheet_range,
+            sheet_info,
+            sheet_data,
+            header_data,
+            campaign_rows,
+            include_raw_rows,
+            timestamp
+        )
+    
+    def _build_extraction_result(
+        self,
+        sheets: GoogleSheetsClient,
+        spreadsheet_id: str,
+        sheet_range: str,
+        sheet_info,
+        sheet_data,
+        header_data,
+        campaign_rows,
+        include_raw_rows: bool,
+        timestamp: str
+    ) -> Dict[str, Any]:
+        """Build the extract_data result from fetched spreadsheet metadata and ranges."""
+        logger.info("Processing spreadsheet: %s", sheet_info.title)
+        
+        if not sheet_data.values:
+            logger.warning("No data found in range %s", sheet_range)
             return {
                 "spreadsheet_id": spreadsheet_id,
                 "range": sheet_range,
                 "rows": [],
                 "headers": [],
                 "extraction_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "row_count": 0,
                     "column_count": 0,
-                    "status": "error",
-                    "error_message": str(e)
+                    "status": "no_data_found"
                 }
             }
+        
+        # Extract headers and data rows
+        rows = sheet_data.values
+        headers = rows[0] if rows else []
+        
+        # Parse campaign data from the prefetched ranges
+        try:
+            if header_data is None or campaign_rows is None:
+                raise ValueError("campaign header and data ranges were not read")
+            campaign_data = sheets.parse_campaign_values(
+                header_data.values[0] if header_data.values else [],
+                campaign_rows.values
+            )
+            
+            # Convert CampaignData objects to dictionaries
+            parsed_campaigns = [campaign.model_dump() for campaign in campaign_data]
+            
+            logger.info("Successfully parsed %d campaigns from spreadsheet %s", len(parsed_campaigns), spreadsheet_id)
+            
+        except Exception as parse_error:
+            logger.warning("Failed to parse campaign data: %s", parse_error)
+            parsed_campaigns = []
+        
+        result = {
+            "spreadsheet_id": spreadsheet_id,
+            "spreadsheet_title": sheet_info.title,
+            "spreadsheet_url": sheet_info.url,
+            "range": sheet_range,
+            "rows": rows,
+            "headers": headers,
+            "parsed_campaigns": parsed_campaigns,
+            "extraction_metadata": {
+                "timestamp": timestamp,
+                "row_count": len(rows),
+                "column_count": len(headers),
+                "campaigns_parsed": len(parsed_campaigns),
+                "status": "success"
+            }
+        }
+        if not include_raw_rows:
+            del result["rows"]
+        return result
+    
+    def _extraction_error(
+        self,
+        spreadsheet_id: str,
+        sheet_range: str,
+        timestamp: str,
+        error: Exception
+    ) -> Dict[str, Any]:
+        """Build the extract_data result for a spreadsheet that could not be read."""
+        return {
+            "spreadsheet_id": spreadsheet_id,
+            "range": sheet_range,
+            "rows": [],
+            "headers": [],
+            "extraction_metadata": {
+                "timestamp": timestamp,
+                "row_count": 0,
+                "column_count": 0,
+                "status": "error",
+                "error_message": str(error)
+            }
+        }
     
     async def discover_campaign_sheets(self) -> Dict[str, Any]:
         """Discover spreadsheets that might contain campaign data."""
+        timestamp = datetime.utcnow().isoformat()
         try:
             logger.info("Discovering campaign-related spreadsheets")
             
             if not self.auth_manager.is_authenticated():
                 raise ValueError("Google API authentication required. Please authenticate first.")
             
-            with self.drive_client as drive, self.sheets_client as sheets:
-                # Find campaign-related spreadsheets
-                campaign_sheets = sheets.find_campaign_sheets(drive)
+            with self.drive_client as drive:
+                # Find campaign-related spreadsheets, fetching sheet details concurrently
+                campaign_sheets = await self.sheets_client.find_campaign_sheets_async(drive)
                 
                 discovery_results = []
                 for sheet_info in campaign_sheets:
+                    # Later extracts of these sheets can skip their metadata request
+                    self._cache_spreadsheet_info(sheet_info.spreadsheet_id, sheet_info)
                     discovery_results.append({
                         "spreadsheet_id": sheet_info.spreadsheet_id,
+                        "mime_type": 'application/vnd.google-apps.spreadsheet',
                         "title": sheet_info.title,
                         "url": sheet_info.url,
-                        "sheets": sheet_info.sheets
+                        "sheets": sheet_info.sheets,
+                        "modified_time": sheet_info.modified_time.isoformat() if sheet_info.modified_time else None
                     })
                 
-                logger.info(f"Discovered {len(discovery_results)} potential campaign spreadsheets")
+                logger.info("Discovered %d potential campaign spreadsheets", len(discovery_results))
                 
                 return {
                     "discovered_sheets": discovery_results,
                     "discovery_metadata": {
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": timestamp,
                         "sheets_found": len(discovery_results),
                         "status": "success"
                     }
                 }
         
         except ValueError as ve:
-            logger.error(f"Authentication error: {ve}")
+            logger.error("Authentication error: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error discovering campaign sheets: {e}")
+            logger.error("Error discovering campaign sheets: %s", e)
             return {
                 "discovered_sheets": [],
                 "discovery_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "sheets_found": 0,
                     "status": "error",
                     "error_message": str(e)
@@ -216,7 +545,12 @@ class GoogleSheetsReader(BaseTool):
 class FileParser(BaseTool):
     """Tool for parsing various file formats and integrating with Google Drive."""
     
-    def __init__(self, auth_manager: Optional[GoogleAuthManager] = None, settings=None):
+    def __init__(
+        self,
+        auth_manager: Optional[GoogleAuthManager] = None,
+        settings=None,
+        sheets_reader: Optional[GoogleSheetsReader] = None
+    ):
         self.name = "file_parser"
         self.description = "Parses various file formats including CSV, Excel, JSON, and XML from Google Drive or local files"
         self.supported_formats = ["csv", "xlsx", "json", "xml", "txt", "sheets"]
@@ -230,7 +564,7 @@ class FileParser(BaseTool):
         self.auth_manager = auth_manager
         self.settings = settings
         self._drive_client = None
-        self._sheets_reader = None
+        self._sheets_reader = sheets_reader
     
     @property
     def drive_client(self) -> GoogleDriveClient:
@@ -246,10 +580,16 @@ class FileParser(BaseTool):
             self._sheets_reader = GoogleSheetsReader(self.auth_manager, self.settings)
         return self._sheets_reader
     
-    async def parse_google_drive_file(self, file_id: str) -> Dict[str, Any]:
-        """Parse a file from Google Drive."""
+    async def parse_google_drive_file(self, file_id: str, include_raw_rows: bool = False) -> Dict[str, Any]:
+        """
+        Parse a file from Google Drive.
+        
+        Google Sheets results hold the raw grid only with include_raw_rows;
+        see parse_file.
+        """
+        timestamp = datetime.utcnow().isoformat()
         try:
-            logger.info(f"Parsing Google Drive file {file_id}")
+            logger.info("Parsing Google Drive file %s", file_id)
             
             if not self.auth_manager.is_authenticated():
                 raise ValueError("Google API authentication required. Please authenticate first.")
@@ -260,11 +600,11 @@ class FileParser(BaseTool):
                 if not file_metadata:
                     raise ValueError(f"File {file_id} not found in Google Drive")
                 
-                logger.info(f"Processing file: {file_metadata.name} ({file_metadata.mime_type})")
+                logger.info("Processing file: %s (%s)", file_metadata.name, file_metadata.mime_type)
                 
                 # Handle Google Sheets
                 if file_metadata.mime_type == 'application/vnd.google-apps.spreadsheet':
-                    return await self._parse_google_sheet(file_id)
+                    return await self._parse_google_sheet(file_id, include_raw_rows)
                 
                 # Handle other file types (future implementation)
                 else:
@@ -275,113 +615,218 @@ class FileParser(BaseTool):
                         "parsing_status": "unsupported",
                         "message": f"File type {file_metadata.mime_type} not yet supported for parsing",
                         "parsing_metadata": {
-                            "timestamp": datetime.utcnow().isoformat(),
+                            "timestamp": timestamp,
                             "file_size": file_metadata.size,
                             "records_parsed": 0
                         }
                     }
         
         except ValueError as ve:
-            logger.error(f"Authentication or file error: {ve}")
+            logger.error("Authentication or file error: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error parsing Google Drive file: {e}")
+            logger.error("Error parsing Google Drive file: %s", e)
             return {
                 "file_id": file_id,
                 "parsing_status": "error",
                 "error_message": str(e),
                 "parsing_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "error": str(e)
                 }
             }
     
-    async def _parse_google_sheet(self, spreadsheet_id: str) -> Dict[str, Any]:
-        """Parse a Google Sheet using the GoogleSheetsReader."""
+    async def _parse_google_sheet(self, spreadsheet_id: str, include_raw_rows: bool = False) -> Dict[str, Any]:
+        """
+        Parse a Google Sheet using the GoogleSheetsReader.
+        
+        Raw rows are only carried along when include_raw_rows is set; parsed
+        campaigns already hold each row's values in raw_row.
+        """
+        timestamp = datetime.utcnow().isoformat()
         try:
             # Use the GoogleSheetsReader to extract data
-            sheet_data = await self.sheets_reader.extract_data(spreadsheet_id)
-            
-            return {
-                "file_id": spreadsheet_id,
-                "file_type": "google_sheets",
-                "parsing_status": "success",
-                "parsed_data": {
-                    "campaigns": sheet_data.get("parsed_campaigns", []),
-                    "raw_data": {
-                        "rows": sheet_data.get("rows", []),
-                        "headers": sheet_data.get("headers", [])
-                    },
-                    "spreadsheet_info": {
-                        "title": sheet_data.get("spreadsheet_title", ""),
-                        "url": sheet_data.get("spreadsheet_url", "")
-                    }
-                },
-                "parsing_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "records_parsed": len(sheet_data.get("parsed_campaigns", [])),
-                    "extraction_metadata": sheet_data.get("extraction_metadata", {})
-                }
-            }
+            sheet_data = await self.sheets_reader.extract_data(
+                spreadsheet_id, include_raw_rows=include_raw_rows
+            )
+            return self._format_parsed_sheet(spreadsheet_id, sheet_data, include_raw_rows, timestamp)
         
         except Exception as e:
-            logger.error(f"Error parsing Google Sheet {spreadsheet_id}: {e}")
-            return {
-                "file_id": spreadsheet_id,
-                "file_type": "google_sheets",
-                "parsing_status": "error",
-                "error_message": str(e),
-                "parsing_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "error": str(e)
+            logger.error("Error parsing Google Sheet %s: %s", spreadsheet_id, e)
+            return self._sheet_parse_error(spreadsheet_id, timestamp, e)
+    
+    def _sheet_parse_error(self, spreadsheet_id: str, timestamp: str, error: Exception) -> Dict[str, Any]:
+        """Build the parse result for a Google Sheet that could not be read."""
+        return {
+            "file_id": spreadsheet_id,
+            "file_type": "google_sheets",
+            "parsing_status": "error",
+            "error_message": str(error),
+            "parsing_metadata": {
+                "timestamp": timestamp,
+                "error": str(error)
+            }
+        }
+    
+    def _format_parsed_sheet(
+        self,
+        spreadsheet_id: str,
+        sheet_data: Dict[str, Any],
+        include_raw_rows: bool,
+        timestamp: str
+    ) -> Dict[str, Any]:
+        """
+        Build the parse result for data already returned by extract_data.
+        
+        This is the only place Google Sheets parse results are assembled, so
+        callers that extracted a sheet reuse that data instead of fetching
+        the spreadsheet a second time.
+        """
+        parsed_campaigns = sheet_data.get("parsed_campaigns", [])
+        raw_data = {"headers": sheet_data.get("headers", [])}
+        if include_raw_rows:
+            raw_data["rows"] = sheet_data.get("rows", [])
+        
+        return {
+            "file_id": spreadsheet_id,
+            "file_type": "google_sheets",
+            "parsing_status": "success",
+            "parsed_data": {
+                "campaigns": parsed_campaigns,
+                "raw_data": raw_data,
+                "spreadsheet_info": {
+                    "title": sheet_data.get("spreadsheet_title", ""),
+                    "url": sheet_data.get("spreadsheet_url", "")
                 }
+            },
+            "parsing_metadata": {
+                "timestamp": timestamp,
+                "records_parsed": len(parsed_campaigns),
+                "extraction_metadata": sheet_data.get("extraction_metadata", {})
             }
+        }
     
-    async def parse_file(self, file_path: str, file_type: str = "auto") -> Dict[str, Any]:
-        """Parse a file and return structured data."""
+    async def parse_file(
+        self,
+        file_path: str,
+        file_type: str = "auto",
+        include_raw_rows: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Parse a file and return structured data.
+        
+        API change: Google Sheets results used to always carry the full grid
+        under parsed_data.raw_data.rows. It is now left out unless
+        include_raw_rows is set, and only the headers are returned by
+        default. Callers that read the rows must pass include_raw_rows=True.
+        """
+        timestamp = datetime.utcnow().isoformat()
         try:
-            logger.info(f"Parsing file {file_path} as {file_type}")
+            logger.info("Parsing file %s as %s", file_path, file_type)
             
             # Check if this is a Google Drive file ID or Sheets URL
             if self._is_google_drive_id(file_path):
-                return await self.parse_google_drive_file(file_path)
+                return await self.parse_google_drive_file(file_path, include_raw_rows)
             elif self._is_google_sheets_url(file_path):
                 spreadsheet_id = self._extract_spreadsheet_id(file_path)
-                return await self._parse_google_sheet(spreadsheet_id)
+                return await self._parse_google_sheet(spreadsheet_id, include_raw_rows)
             
             # For local files, return a placeholder implementation
             # This would be enhanced to handle actual local file parsing
-            logger.warning(f"Local file parsing not yet implemented for {file_path}")
+            logger.warning("Local file parsing not yet implemented for %s", file_path)
             return {
                 "file_path": file_path,
                 "file_type": file_type,
                 "parsing_status": "not_implemented",
                 "message": "Local file parsing not yet implemented. Use Google Drive files instead.",
                 "parsing_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "records_parsed": 0
                 }
             }
             
         except Exception as e:
-            logger.error(f"Error parsing file: {e}")
+            logger.error("Error parsing file: %s", e)
             return {
                 "file_path": file_path,
                 "file_type": file_type,
                 "parsing_status": "error",
                 "error_message": str(e),
                 "parsing_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "error": str(e)
                 }
             }
     
+    async def parse_files(
+        self,
+        file_paths: List[str],
+        file_type: str = "auto",
+        include_raw_rows: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse several files, fetching each distinct spreadsheet only once.
+        
+        Drive IDs and Sheets URLs that point at the same spreadsheet share a
+        single parse result. Spreadsheets named by a Sheets URL are read
+        together with GoogleSheetsReader.extract_data_batch, and the other
+        paths are parsed concurrently. Raw rows follow include_raw_rows as
+        in parse_file. Returns the results keyed by input path.
+        """
+        timestamp = datetime.utcnow().isoformat()
+        targets = {file_path: self._parse_target(file_path) for file_path in file_paths}
+        # Only Sheets URLs resolve to a target other than the path itself
+        sheet_ids = list(dict.fromkeys(
+            target for file_path, target in targets.items() if target != file_path
+        ))
+        other_paths: Dict[str, str] = {}
+        for file_path, target in targets.items():
+            if target not in sheet_ids:
+                other_paths.setdefault(target, file_path)
+        
+        async def parse_sheets() -> Dict[str, Dict[str, Any]]:
+            if not sheet_ids:
+                return {}
+            try:
+                sheet_data = await self.sheets_reader.extract_data_batch(
+                    sheet_ids, include_raw_rows=include_raw_rows
+                )
+            except Exception as e:
+                logger.error("Error parsing %d Google Sheets: %s", len(sheet_ids), e)
+                return {
+                    spreadsheet_id: self._sheet_parse_error(spreadsheet_id, timestamp, e)
+                    for spreadsheet_id in sheet_ids
+                }
+            return {
+                spreadsheet_id: self._format_parsed_sheet(
+                    spreadsheet_id, sheet_data[spreadsheet_id], include_raw_rows, timestamp
+                )
+                for spreadsheet_id in sheet_ids
+            }
+        
+        parsed_sheets, parsed_others = await asyncio.gather(
+            parse_sheets(),
+            asyncio.gather(*(
+                self.parse_file(file_path, file_type, include_raw_rows)
+                for file_path in other_paths.values()
+            ))
+        )
+        parsed_by_target = {**parsed_sheets, **dict(zip(other_paths, parsed_others))}
+        
+        return {file_path: parsed_by_target[target] for file_path, target in targets.items()}
+    
+    def _parse_target(self, file_path: str) -> str:
+        """Get the spreadsheet or file ID a path resolves to, or the path itself."""
+        if not self._is_google_drive_id(file_path) and self._is_google_sheets_url(file_path):
+            try:
+                return self._extract_spreadsheet_id(file_path)
+            except ValueError:
+                pass
+        return file_path
+    
     def _is_google_drive_id(self, file_path: str) -> bool:
         """Check if the file_path is a Google Drive file ID."""
-        # Google Drive file IDs are typically 33-44 characters long and alphanumeric with underscores/hyphens
-        import re
-        pattern = r'^[a-zA-Z0-9_-]{28,}$'
-        return bool(re.match(pattern, file_path))
+        return bool(_DRIVE_ID_RE.match(file_path))
     
     def _is_google_sheets_url(self, file_path: str) -> bool:
         """Check if the file_path is a Google Sheets URL."""
@@ -389,9 +834,7 @@ class FileParser(BaseTool):
     
     def _extract_spreadsheet_id(self, sheets_url: str) -> str:
         """Extract spreadsheet ID from Google Sheets URL."""
-        import re
-        pattern = r'/spreadsheets/d/([a-zA-Z0-9-_]+)'
-        match = re.search(pattern, sheets_url)
+        match = _SHEETS_URL_RE.search(sheets_url)
         if match:
             return match.group(1)
         raise ValueError(f"Could not extract spreadsheet ID from URL: {sheets_url}")
@@ -420,9 +863,34 @@ class DataValidator(BaseTool):
                 "required_headers": ["Campaign", "Budget"]
             }
         }
+        
+        # Rule values used on every validation call
+        campaign_rules = self.validation_rules["campaign_data"]
+        self._required_campaign_fields = tuple(campaign_rules["required_fields"])
+        self._required_headers = tuple(self.validation_rules["sheet_data"]["required_headers"])
+        self._min_rows = self.validation_rules["sheet_data"]["min_rows"]
+        self._budget_min = campaign_rules["budget_min"]
+        self._budget_max = campaign_rules["budget_max"]
+        self._valid_platforms = frozenset(
+            _normalize_platform(str(platform))
+            for platform in campaign_rules["valid_platforms"]
+        )
+        self._valid_platforms_repr = str(campaign_rules["valid_platforms"])
     
-    async def validate_extracted_sheet_data(self, sheet_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate Google Sheets data from the new extract_data format."""
+    async def validate_extracted_sheet_data(
+        self,
+        sheet_data: Dict[str, Any],
+        stop_early: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate Google Sheets data from the new extract_data format.
+        
+        With stop_early, campaign checks stop as soon as more than half of the
+        campaigns are invalid, since the data quality threshold can no longer
+        be met. The result is then marked with early_exited in its metadata and
+        only holds warnings for the campaigns checked so far.
+        """
+        timestamp = datetime.utcnow().isoformat()
         try:
             validation_result = {
                 "is_valid": True,
@@ -431,72 +899,91 @@ class DataValidator(BaseTool):
                 "validated_fields": [],
                 "data_quality_score": 0.0
             }
+            errors = validation_result["errors"]
+            warnings = validation_result["warnings"]
+            validated_fields = validation_result["validated_fields"]
             
             # Check if extraction was successful
             extraction_metadata = sheet_data.get("extraction_metadata", {})
             if extraction_metadata.get("status") == "error":
-                validation_result["errors"].append(f"Data extraction failed: {extraction_metadata.get('error_message', 'Unknown error')}")
+                errors.append(f"Data extraction failed: {extraction_metadata.get('error_message', 'Unknown error')}")
                 validation_result["is_valid"] = False
                 return validation_result
             elif extraction_metadata.get("status") == "no_data_found":
-                validation_result["warnings"].append("No data found in the specified range")
+                warnings.append("No data found in the specified range")
                 validation_result["data_quality_score"] = 0.0
                 return validation_result
             
-            rows = sheet_data.get("rows", [])
+            rows = sheet_data.get("rows")
             headers = sheet_data.get("headers", [])
             parsed_campaigns = sheet_data.get("parsed_campaigns", [])
             
+            # Extractions made without raw rows still report their row count
+            row_count = len(rows) if rows is not None else extraction_metadata.get("row_count", 0)
+            header_count = len(headers)
+            min_rows = self._min_rows
+            
             # Validate basic structure
-            if len(rows) < self.validation_rules["sheet_data"]["min_rows"]:
-                validation_result["errors"].append(
-                    f"Insufficient data rows. Found {len(rows)}, minimum required: {self.validation_rules['sheet_data']['min_rows']}"
+            if row_count < min_rows:
+                errors.append(
+                    f"Insufficient data rows. Found {row_count}, minimum required: {min_rows}"
                 )
                 validation_result["is_valid"] = False
             
             # Validate headers
-            for required_header in self.validation_rules["sheet_data"]["required_headers"]:
+            lowered_headers = tuple(header.lower() for header in headers)
+            for required_header in self._required_headers:
+                required_lower = required_header.lower()
                 header_found = any(
-                    required_header.lower() in header.lower() 
-                    for header in headers
+                    required_lower in header
+                    for header in lowered_headers
                 )
                 if not header_found:
-                    validation_result["errors"].append(f"Missing required header containing: {required_header}")
+                    errors.append(f"Missing required header containing: {required_header}")
                     validation_result["is_valid"] = False
                 else:
-                    validation_result["validated_fields"].append(f"header_{required_header}")
+                    validated_fields.append(f"header_{required_header}")
+            
+            # Bind campaign rules once for the per-campaign loop
+            required_fields = self._required_campaign_fields
+            budget_min = self._budget_min
+            budget_max = self._budget_max
+            valid_platforms = self._valid_platforms_repr
+            valid_platform_set = self._valid_platforms
             
             # Validate parsed campaigns
+            total_campaigns = len(parsed_campaigns)
             campaigns_validated = 0
+            early_exited = False
             for i, campaign in enumerate(parsed_campaigns):
                 campaign_valid = True
                 
                 # Check required fields
-                for field in self.validation_rules["campaign_data"]["required_fields"]:
+                for field in required_fields:
                     if not campaign.get(field):
-                        validation_result["warnings"].append(f"Campaign {i+1}: Missing or empty required field '{field}'")
+                        warnings.append(f"Campaign {i+1}: Missing or empty required field '{field}'")
                         campaign_valid = False
                     else:
-                        validation_result["validated_fields"].append(f"campaign_{i+1}_{field}")
+                        validated_fields.append(f"campaign_{i+1}_{field}")
                 
                 # Validate budget
                 budget = campaign.get("budget")
                 if budget is not None:
-                    if budget < self.validation_rules["campaign_data"]["budget_min"]:
-                        validation_result["warnings"].append(
-                            f"Campaign {i+1}: Budget ${budget} is below recommended minimum ${self.validation_rules['campaign_data']['budget_min']}"
+                    if budget < budget_min:
+                        warnings.append(
+                            f"Campaign {i+1}: Budget ${budget} is below recommended minimum ${budget_min}"
                         )
-                    elif budget > self.validation_rules["campaign_data"]["budget_max"]:
-                        validation_result["warnings"].append(
-                            f"Campaign {i+1}: Budget ${budget} exceeds maximum ${self.validation_rules['campaign_data']['budget_max']}"
+                    elif budget > budget_max:
+                        warnings.append(
+                            f"Campaign {i+1}: Budget ${budget} exceeds maximum ${budget_max}"
                         )
                 
                 # Validate platform
                 platform = campaign.get("platform")
                 if platform:
-                    valid_platforms = self.validation_rules["campaign_data"]["valid_platforms"]
-                    if platform not in valid_platforms:
-                        validation_result["warnings"].append(
+                    # Sheet cells may hold non-strings, which can't be cache keys
+                    if _normalize_platform(str(platform)) not in valid_platform_set:
+                        warnings.append(
                             f"Campaign {i+1}: Platform '{platform}' not in standard list: {valid_platforms}"
                         )
                 
@@ -507,15 +994,18 @@ class DataValidator(BaseTool):
                     try:
                         # Basic date validation - could be enhanced with proper date parsing
                         if len(start_date) < 8 or len(end_date) < 8:
-                            validation_result["warnings"].append(f"Campaign {i+1}: Date format may be invalid")
+                            warnings.append(f"Campaign {i+1}: Date format may be invalid")
                     except Exception:
-                        validation_result["warnings"].append(f"Campaign {i+1}: Could not validate date format")
+                        warnings.append(f"Campaign {i+1}: Could not validate date format")
                 
                 if campaign_valid:
                     campaigns_validated += 1
+                elif stop_early and (i + 1 - campaigns_validated) * 2 > total_campaigns:
+                    # The quality score can no longer reach 50%
+                    early_exited = True
+                    break
             
             # Calculate data quality score
-            total_campaigns = len(parsed_campaigns)
             if total_campaigns > 0:
                 validation_result["data_quality_score"] = campaigns_validated / total_campaigns
             else:
@@ -524,21 +1014,23 @@ class DataValidator(BaseTool):
             # Overall validation status
             if validation_result["data_quality_score"] < 0.5 and total_campaigns > 0:
                 validation_result["is_valid"] = False
-                validation_result["errors"].append("Data quality score is below acceptable threshold (50%)")
+                errors.append("Data quality score is below acceptable threshold (50%)")
             
             validation_result["validation_metadata"] = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "rows_validated": len(rows),
-                "headers_validated": len(headers),
+                "timestamp": timestamp,
+                "rows_validated": row_count,
+                "headers_validated": header_count,
                 "campaigns_validated": campaigns_validated,
                 "total_campaigns": total_campaigns,
                 "data_quality_score": validation_result["data_quality_score"]
             }
+            if early_exited:
+                validation_result["validation_metadata"]["early_exited"] = True
             
             return validation_result
             
         except Exception as e:
-            logger.error(f"Error validating extracted sheet data: {e}")
+            logger.error("Error validating extracted sheet data: %s", e)
             return {
                 "is_valid": False,
                 "errors": [f"Validation failed: {str(e)}"],
@@ -546,7 +1038,7 @@ class DataValidator(BaseTool):
                 "validated_fields": [],
                 "data_quality_score": 0.0,
                 "validation_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "validation_error": str(e)
                 }
             }
@@ -559,6 +1051,28 @@ class DataValidator(BaseTool):
                 return await self.validate_extracted_sheet_data(sheet_data)
             
             # Legacy validation for old format
+            return await self.validate_sheet_data_streaming(
+                sheet_data.get("headers", []),
+                sheet_data.get("rows", [])
+            )
+            
+        except Exception as e:
+            logger.error("Error validating sheet data: %s", e)
+            raise
+    
+    async def validate_sheet_data_streaming(
+        self,
+        headers: List[str],
+        row_iter: Iterable[List[Any]]
+    ) -> Dict[str, Any]:
+        """
+        Validate legacy sheet data in a single pass over its rows.
+        
+        row_iter yields every row, header row first, so rows can be streamed
+        from their source without holding the whole grid in memory.
+        """
+        try:
+            timestamp = datetime.utcnow().isoformat()
             validation_result = {
                 "is_valid": True,
                 "errors": [],
@@ -566,52 +1080,62 @@ class DataValidator(BaseTool):
                 "validated_fields": []
             }
             
-            rows = sheet_data.get("rows", [])
-            headers = sheet_data.get("headers", [])
-            
-            # Check minimum rows
-            if len(rows) < self.validation_rules["sheet_data"]["min_rows"]:
-                validation_result["errors"].append(
-                    f"Insufficient data rows. Found {len(rows)}, minimum required: {self.validation_rules['sheet_data']['min_rows']}"
-                )
-                validation_result["is_valid"] = False
+            # Map each header to its first column index
+            header_index = {}
+            for index, header in enumerate(headers):
+                header_index.setdefault(header, index)
             
             # Check required headers
-            for required_header in self.validation_rules["sheet_data"]["required_headers"]:
-                if required_header not in headers:
+            for required_header in self._required_headers:
+                if required_header not in header_index:
                     validation_result["errors"].append(f"Missing required header: {required_header}")
                     validation_result["is_valid"] = False
                 else:
                     validation_result["validated_fields"].append(required_header)
             
-            # Check for empty cells in critical columns
-            if "Budget" in headers:
-                budget_col_index = headers.index("Budget")
-                for i, row in enumerate(rows[1:], 1):  # Skip header row
+            # Count rows and check for empty cells in critical columns
+            budget_col_index = header_index.get("Budget")
+            warnings_append = validation_result["warnings"].append
+            row_count = 0
+            for row_count, row in enumerate(row_iter, 1):
+                if row_count > 1 and budget_col_index is not None:  # Skip header row
                     if len(row) <= budget_col_index or not row[budget_col_index]:
-                        validation_result["warnings"].append(f"Empty budget value in row {i+1}")
+                        warnings_append(f"Empty budget value in row {row_count}")
+            
+            # Check minimum rows, reported ahead of the header errors
+            min_rows = self._min_rows
+            if row_count < min_rows:
+                validation_result["errors"].insert(
+                    0,
+                    f"Insufficient data rows. Found {row_count}, minimum required: {min_rows}"
+                )
+                validation_result["is_valid"] = False
             
             validation_result["validation_metadata"] = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "rows_validated": len(rows),
+                "timestamp": timestamp,
+                "rows_validated": row_count,
                 "headers_validated": len(headers)
             }
             
             return validation_result
             
         except Exception as e:
-            logger.error(f"Error validating sheet data: {e}")
+            logger.error("Error validating sheet data: %s", e)
             raise
     
     async def validate_campaign_data(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate campaign data."""
         try:
+            timestamp = datetime.utcnow().isoformat()
             validation_result = {
                 "is_valid": True,
                 "errors": [],
                 "warnings": [],
                 "validated_fields": []
             }
+            errors = validation_result["errors"]
+            warnings = validation_result["warnings"]
+            validated_fields = validation_result["validated_fields"]
             
             # Handle new format with parsed_campaigns
             if "parsed_campaigns" in campaign_data:
@@ -621,47 +1145,54 @@ class DataValidator(BaseTool):
                 parsed_data = campaign_data.get("parsed_data", {})
                 campaigns = parsed_data.get("campaigns", [])
             
+            # Bind campaign rules once for the per-campaign loop
+            required_fields = self._required_campaign_fields
+            budget_min = self._budget_min
+            budget_max = self._budget_max
+            valid_platforms = self._valid_platforms_repr
+            valid_platform_set = self._valid_platforms
+            
             for i, campaign in enumerate(campaigns):
                 # Check required fields
-                for field in self.validation_rules["campaign_data"]["required_fields"]:
+                for field in required_fields:
                     # Handle both old and new field names
                     value = campaign.get(field) or campaign.get(field.replace("campaign_", ""))
                     if not value:
-                        validation_result["errors"].append(f"Campaign {i+1}: Missing required field '{field}'")
+                        errors.append(f"Campaign {i+1}: Missing required field '{field}'")
                         validation_result["is_valid"] = False
                     else:
-                        validation_result["validated_fields"].append(f"campaign_{i+1}_{field}")
+                        validated_fields.append(f"campaign_{i+1}_{field}")
                 
                 # Validate budget range
                 budget = campaign.get("budget")
                 if budget:
-                    if budget < self.validation_rules["campaign_data"]["budget_min"]:
-                        validation_result["warnings"].append(
-                            f"Campaign {i+1}: Budget ${budget} is below recommended minimum ${self.validation_rules['campaign_data']['budget_min']}"
+                    if budget < budget_min:
+                        warnings.append(
+                            f"Campaign {i+1}: Budget ${budget} is below recommended minimum ${budget_min}"
                         )
-                    elif budget > self.validation_rules["campaign_data"]["budget_max"]:
-                        validation_result["warnings"].append(
-                            f"Campaign {i+1}: Budget ${budget} exceeds maximum ${self.validation_rules['campaign_data']['budget_max']}"
+                    elif budget > budget_max:
+                        warnings.append(
+                            f"Campaign {i+1}: Budget ${budget} exceeds maximum ${budget_max}"
                         )
                 
                 # Validate platform
                 platform = campaign.get("platform")
                 if platform:
-                    valid_platforms = self.validation_rules["campaign_data"]["valid_platforms"]
-                    if platform not in valid_platforms:
-                        validation_result["warnings"].append(
+                    # Sheet cells may hold non-strings, which can't be cache keys
+                    if _normalize_platform(str(platform)) not in valid_platform_set:
+                        warnings.append(
                             f"Campaign {i+1}: Platform '{platform}' not in standard list: {valid_platforms}"
                         )
             
             validation_result["validation_metadata"] = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "campaigns_validated": len(campaigns)
             }
             
             return validation_result
             
         except Exception as e:
-            logger.error(f"Error validating campaign data: {e}")
+            logger.error("Error validating campaign data: %s", e)
             raise
     
     async def validate_data(self, data: Dict[str, Any], validation_type: str) -> Dict[str, Any]:
@@ -716,6 +1247,7 @@ class WorkspaceManager(BaseTool):
         self._sheets_reader = None
         self._file_parser = None
         self._data_validator = None
+        self._validation_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
     
     @property
     def drive_client(self) -> GoogleDriveClient:
@@ -735,7 +1267,7 @@ class WorkspaceManager(BaseTool):
     def file_parser(self) -> FileParser:
         """Get or create FileParser instance."""
         if self._file_parser is None:
-            self._file_parser = FileParser(self.auth_manager, self.settings)
+            self._file_parser = FileParser(self.auth_manager, self.settings, sheets_reader=self.sheets_reader)
         return self._file_parser
     
     @property
@@ -745,22 +1277,63 @@ class WorkspaceManager(BaseTool):
             self._data_validator = DataValidator()
         return self._data_validator
     
+    def _validation_cache_key(self, file_info: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Key a file's validation result by spreadsheet ID and Drive revision time."""
+        spreadsheet_id = file_info.get("spreadsheet_id")
+        modified_time = file_info.get("modified_time")
+        if not spreadsheet_id or not modified_time:
+            return None
+        return spreadsheet_id, modified_time
+    
+    def _get_cached_validation(self, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached validation result for an unchanged spreadsheet, if any."""
+        key = self._validation_cache_key(file_info)
+        validation_result = self._validation_cache.get(key) if key is not None else None
+        if validation_result is None:
+            return None
+        self._validation_cache.move_to_end(key)
+        # Hand out a copy so callers can't change the cached result or share its lists
+        return {**copy.deepcopy(validation_result), "file_info": file_info}
+    
+    def _cache_validation(self, file_info: Dict[str, Any], validation_result: Dict[str, Any]) -> None:
+        """Store a validation result, evicting the least recently used entry once full."""
+        key = self._validation_cache_key(file_info)
+        if key is None:
+            return
+        self._validation_cache[key] = copy.deepcopy(validation_result)
+        self._validation_cache.move_to_end(key)
+        if len(self._validation_cache) > _VALIDATION_CACHE_MAX_ENTRIES:
+            self._validation_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Clear cached validation results."""
+        self._validation_cache.clear()
+    
     async def discover_campaign_files(self) -> Dict[str, Any]:
-        """Discover campaign-related files in Google Drive."""
+        """
+        Discover campaign-related files in Google Drive.
+        
+        The Drive keyword search runs in a worker thread on its own HTTP
+        transport, concurrently with spreadsheet discovery.
+        """
+        timestamp = datetime.utcnow().isoformat()
         try:
             logger.info("Discovering campaign files in workspace")
             
             if not self.auth_manager.is_authenticated():
                 raise ValueError("Google API authentication required. Please authenticate first.")
             
-            # Discover campaign sheets
-            discovery_result = await self.sheets_reader.discover_campaign_sheets()
-            
-            # Get additional file information from Drive
             with self.drive_client as drive:
-                # Search for additional campaign-related files
+                # Build the service here so the worker thread doesn't have to
+                drive.service
+                http = self.auth_manager.create_authorized_http()
+                
+                # Discover campaign sheets while searching Drive for other campaign-related files
                 campaign_keywords = ['campaign', 'media', 'planning', 'budget', 'ads', 'marketing']
-                campaign_files = drive.find_campaign_files(campaign_keywords)
+                discovery_result, campaign_files = await asyncio.gather(
+                    self.sheets_reader.discover_campaign_sheets(),
+                    asyncio.to_thread(drive.find_campaign_files, campaign_keywords, http=http)
+                )
                 
                 # Filter out spreadsheets (already found by sheets_reader)
                 non_sheet_files = [
@@ -782,76 +1355,149 @@ class WorkspaceManager(BaseTool):
                 "discovered_spreadsheets": discovery_result.get("discovered_sheets", []),
                 "discovered_files": non_sheet_files,
                 "operation_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "spreadsheets_found": len(discovery_result.get("discovered_sheets", [])),
                     "other_files_found": len(non_sheet_files)
                 }
             }
         
         except ValueError as ve:
-            logger.error(f"Authentication error: {ve}")
+            logger.error("Authentication error: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error discovering campaign files: {e}")
+            logger.error("Error discovering campaign files: %s", e)
             return {
                 "operation": "discover_campaign_files",
                 "status": "error",
                 "error_message": str(e),
                 "operation_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "error": str(e)
                 }
             }
     
-    async def validate_workspace(self, discovered_files: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Validate the workspace data quality."""
+    async def validate_workspace(
+        self,
+        discovered_files: List[Dict[str, Any]],
+        max_concurrency: int = 8,
+        fail_fast: bool = False,
+        skip_filter: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate the workspace data quality.
+        
+        All spreadsheets are extracted up front with batched Sheets requests,
+        with at most max_concurrency batches in flight at once, and then
+        validated in their original order. Results are cached by spreadsheet
+        ID and Drive modified_time, so files unchanged since an earlier call
+        skip both extraction and validation.
+        
+        With fail_fast, spreadsheets are extracted one batch at a time and
+        validation stops at the first invalid file, for callers that only
+        need overall_valid; validation_results then covers the files
+        checked so far.
+        
+        Files that aren't Google Sheets are ignored. Callers passing
+        discovered_spreadsheets from discover_campaign_files, which only
+        holds spreadsheets, can set skip_filter to skip that check.
+        """
+        timestamp = datetime.utcnow().isoformat()
         try:
             logger.info("Validating workspace data")
             
+            if skip_filter:
+                spreadsheet_files = list(discovered_files)
+            else:
+                spreadsheet_files = [
+                    file_info
+                    for file_info in discovered_files
+                    if file_info.get("mime_type") == 'application/vnd.google-apps.spreadsheet'
+                ]
+            
+            async def extract_files(files: List[Dict[str, Any]]):
+                spreadsheet_ids = [file_info["spreadsheet_id"] for file_info in files if "spreadsheet_id" in file_info]
+                if not spreadsheet_ids:
+                    return {}, None
+                try:
+                    extracted_sheets = await self.sheets_reader.extract_data_batch(
+                        spreadsheet_ids,
+                        max_concurrency=max_concurrency
+                    )
+                    return extracted_sheets, None
+                except Exception as e:
+                    return {}, e
+            
+            async def validate_file(file_info: Dict[str, Any]) -> Dict[str, Any]:
+                try:
+                    if extraction_error is not None:
+                        raise extraction_error
+                    sheet_data = extracted_sheets[file_info["spreadsheet_id"]]
+                    validation_result = await self.data_validator.validate_data(sheet_data, "extracted_sheet_data")
+                    # Failed reads are worth retrying, so only cache results for sheets that were read
+                    if sheet_data.get("extraction_metadata", {}).get("status") != "error":
+                        self._cache_validation(file_info, validation_result)
+                    validation_result["file_info"] = file_info
+                    return validation_result
+                
+                except Exception as e:
+                    logger.warning("Failed to validate %s: %s", file_info.get('title', 'unknown'), e)
+                    return {
+                        "is_valid": False,
+                        "errors": [f"Validation failed: {str(e)}"],
+                        "file_info": file_info
+                    }
+            
+            chunk_size = _SHEETS_BATCH_SIZE if fail_fast else max(len(spreadsheet_files), 1)
             validation_results = []
-            overall_valid = True
+            files_passed = 0
+            stopped_early = False
+            for start in range(0, len(spreadsheet_files), chunk_size):
+                chunk = spreadsheet_files[start:start + chunk_size]
+                # Spreadsheets unchanged since their last validation skip extraction
+                cached_results = [self._get_cached_validation(file_info) for file_info in chunk]
+                extracted_sheets, extraction_error = await extract_files([
+                    file_info
+                    for file_info, cached_result in zip(chunk, cached_results)
+                    if cached_result is None
+                ])
+                for file_info, validation_result in zip(chunk, cached_results):
+                    if validation_result is None:
+                        validation_result = await validate_file(file_info)
+                    validation_results.append(validation_result)
+                    if validation_result["is_valid"]:
+                        files_passed += 1
+                    elif fail_fast:
+                        stopped_early = True
+                        break
+                if stopped_early:
+                    break
             
-            for file_info in discovered_files:
-                if file_info.get("mime_type") == 'application/vnd.google-apps.spreadsheet':
-                    # Validate spreadsheet data
-                    try:
-                        sheet_data = await self.sheets_reader.extract_data(file_info["spreadsheet_id"])
-                        validation_result = await self.data_validator.validate_data(sheet_data, "extracted_sheet_data")
-                        validation_result["file_info"] = file_info
-                        validation_results.append(validation_result)
-                        
-                        if not validation_result["is_valid"]:
-                            overall_valid = False
-                    
-                    except Exception as e:
-                        logger.warning(f"Failed to validate {file_info.get('title', 'unknown')}: {e}")
-                        validation_results.append({
-                            "is_valid": False,
-                            "errors": [f"Validation failed: {str(e)}"],
-                            "file_info": file_info
-                        })
-                        overall_valid = False
+            overall_valid = files_passed == len(validation_results)
+            
+            operation_metadata = {
+                "timestamp": timestamp,
+                "files_validated": len(validation_results),
+                "files_passed": files_passed
+            }
+            if stopped_early:
+                operation_metadata["stopped_early"] = True
             
             return {
                 "operation": "validate_workspace",
                 "status": "completed",
                 "overall_valid": overall_valid,
                 "validation_results": validation_results,
-                "operation_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "files_validated": len(validation_results),
-                    "files_passed": sum(1 for r in validation_results if r["is_valid"])
-                }
+                "operation_metadata": operation_metadata
             }
         
         except Exception as e:
-            logger.error(f"Error validating workspace: {e}")
+            logger.error("Error validating workspace: %s", e)
             return {
                 "operation": "validate_workspace",
                 "status": "error",
                 "error_message": str(e),
                 "operation_metadata": {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "error": str(e)
                 }
             }
@@ -859,7 +1505,7 @@ class WorkspaceManager(BaseTool):
     async def execute_operation(self, operation: str, operation_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a workspace operation."""
         try:
-            logger.info(f"Executing workspace operation: {operation}")
+            logger.info("Executing workspace operation: %s", operation)
             
             if operation not in self.supported_operations:
                 raise ValueError(f"Unsupported operation: {operation}")
@@ -874,7 +1520,11 @@ class WorkspaceManager(BaseTool):
             elif operation == "setup_workspace":
                 # Comprehensive workspace setup
                 discovery_result = await self.discover_campaign_files()
-                validation_result = await self.validate_workspace(discovery_result.get("discovered_spreadsheets", []))
+                validation_result = await self.validate_workspace(
+                    discovery_result.get("discovered_spreadsheets", []),
+                    fail_fast=True,
+                    skip_filter=True
+                )
                 
                 return {
                     "operation": "setup_workspace",
@@ -900,10 +1550,10 @@ class WorkspaceManager(BaseTool):
                 }
             
         except ValueError as ve:
-            logger.error(f"Operation error: {ve}")
+            logger.error("Operation error: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error executing workspace operation: {e}")
+            logger.error("Error executing workspace operation: %s", e)
             return {
                 "operation": operation,
                 "status": "error",
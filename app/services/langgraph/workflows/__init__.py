@@ -13,8 +13,15 @@ def get_supervisor_workflow():
     from .supervisor import SupervisorWorkflow
     return SupervisorWorkflow
 
+def __getattr__(name):
+    """Resolve SupervisorWorkflow on first access instead of at package import."""
+    if name == "SupervisorWorkflow":
+        return get_supervisor_workflow()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "get_supervisor_workflow",
+    "SupervisorWorkflow",
     "AgentState", 
     "CampaignPlanningState",
     "CommandInterface",
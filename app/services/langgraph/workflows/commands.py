@@ -5,12 +5,16 @@ Implements the Command design pattern for inter-agent communication,
 allowing for flexible, decoupled agent interactions.
 """
 
+import asyncio
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Type
 from datetime import datetime
 from enum import Enum
-import uuid
 
 from langchain.schema import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langgraph.types import Command
@@ -19,6 +23,65 @@ from .state_models import AgentState, AgentRole, WorkflowStage, AgentTask, TaskS
 
 logger = logging.getLogger(__name__)
 
+# Random bytes drawn at once for command IDs (256 IDs per refill)
+_COMMAND_ID_POOL_BYTES = 4096
+_UUID_VARIANT_DIGITS = "89ab"
+
+
+class _CommandIdPool(threading.local):
+    """Per-thread block of random bytes that command IDs are sliced from."""
+    
+    def __init__(self):
+        self.buffer = b""
+        self.offset = 0
+
+
+_command_id_pool = _CommandIdPool()
+
+
+def _reset_command_id_pool() -> None:
+    """Drop pooled bytes in a forked child so it can't reuse the parent's IDs."""
+    _command_id_pool.buffer = b""
+    _command_id_pool.offset = 0
+
+
+os.register_at_fork(after_in_child=_reset_command_id_pool)
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() timestamp to a local naive datetime."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+def _new_command_id() -> str:
+    """
+    Generate a random version 4 UUID string for a command.
+    
+    Equivalent to str(uuid.uuid4()), but 16 bytes at a time are sliced from
+    a pooled os.urandom() block instead of making one urandom call and
+    building one UUID object per command.
+    """
+    pool = _command_id_pool
+    offset = pool.offset
+    if offset + 16 > len(pool.buffer):
+        pool.buffer = os.urandom(_COMMAND_ID_POOL_BYTES)
+        offset = 0
+    pool.offset = offset + 16
+    
+    h = pool.buffer[offset:offset + 16].hex()
+    # Set the version and RFC 4122 variant bits as uuid4() does
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT_DIGITS[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
+# Workflow stage entered when control is handed off to each agent
+_TARGET_TO_STAGE: Mapping[AgentRole, WorkflowStage] = MappingProxyType({
+    AgentRole.WORKSPACE: WorkflowStage.WORKSPACE_ANALYSIS,
+    AgentRole.PLANNING: WorkflowStage.PLANNING,
+    AgentRole.INSIGHTS: WorkflowStage.INSIGHTS_GENERATION,
+    AgentRole.SUPERVISOR: WorkflowStage.SUPERVISOR_REVIEW
+})
+
 
 class CommandType(str, Enum):
     """Types of commands for agent communication."""
@@ -50,18 +113,39 @@ class CommandInterface(ABC):
         timeout: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None
     ):
-        self.command_id = command_id or str(uuid.uuid4())
+        self.command_id = command_id or _new_command_id()
         self.command_type = command_type
         self.priority = priority
         self.timeout = timeout
         self.metadata = metadata or {}
-        self.created_at = datetime.now()
-        self.executed_at: Optional[datetime] = None
-        self.completed_at: Optional[datetime] = None
+        # Lifecycle times are recorded as time.time_ns() and only turned
+        # into datetimes when read
+        self._created_ns = time.time_ns()
+        self._executed_ns: Optional[int] = None
+        self._completed_ns: Optional[int] = None
         self.status = "pending"
         self.result: Optional[Dict[str, Any]] = None
         self.error: Optional[str] = None
     
+    @property
+    def created_at(self) -> datetime:
+        """When the command was created."""
+        return _ns_to_datetime(self._created_ns)
+    
+    @property
+    def executed_at(self) -> Optional[datetime]:
+        """When the command started executing, if it has."""
+        if self._executed_ns is None:
+            return None
+        return _ns_to_datetime(self._executed_ns)
+    
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """When the command completed or failed, if it has."""
+        if self._completed_ns is None:
+            return None
+        return _ns_to_datetime(self._completed_ns)
+    
     @abstractmethod
     async def execute(self, state: AgentState) -> Dict[str, Any]:
         """Execute the command with the given state."""
@@ -76,6 +160,15 @@ class CommandInterface(ABC):
         """Check if the command can be executed in the current state."""
         return True
     
+    def coalesce_key(self) -> Optional[tuple]:
+        """
+        Key shared by commands with identical effects.
+        
+        CommandBatch runs only one command per key and gives the others its
+        result. Returns None, the default, for commands that must always run.
+        """
+        return None
+    
     def get_command_info(self) -> Dict[str, Any]:
         """Get information about the command."""
         return {
@@ -84,8 +177,8 @@ class CommandInterface(ABC):
             "priority": self.priority.value,
             "status": self.status,
             "created_at": self.created_at.isoformat(),
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "executed_at": _ns_to_datetime(self._executed_ns).isoformat() if self._executed_ns is not None else None,
+            "completed_at": _ns_to_datetime(self._completed_ns).isoformat() if self._completed_ns is not None else None,
             "metadata": self.metadata,
             "has_error": bool(self.error)
         }
@@ -105,51 +198,59 @@ class AgentHandoffCommand(CommandInterface):
         super().__init__(command_type=CommandType.HANDOFF, **kwargs)
         self.target_agent = target_agent
         self.source_agent = source_agent
+        self._target_value = target_agent.value
+        self._source_value = source_agent.value
         self.handoff_message = handoff_message
         self.handoff_data = handoff_data or {}
     
+    def coalesce_key(self) -> Optional[tuple]:
+        """Identical handoffs between the same agents only need to happen once."""
+        return (
+            self.command_type,
+            self.target_agent,
+            self.source_agent,
+            self.handoff_message,
+            repr(self.handoff_data)
+        )
+    
     async def execute(self, state: AgentState) -> Dict[str, Any]:
         """Execute the handoff command."""
         try:
-            self.executed_at = datetime.now()
+            self._executed_ns = time.time_ns()
             self.status = "executing"
             
             # Log the handoff
-            logger.info(f"Agent handoff: {self.source_agent.value} -> {self.target_agent.value}")
+            logger.info("Agent handoff: %s -> %s", self._source_value, self._target_value)
             
             # Update state with handoff information
             state.next_agent = self.target_agent
             
-            # Add handoff message to the state
-            handoff_msg = HumanMessage(
-                content=f"Handoff from {self.source_agent.value}: {self.handoff_message}",
+            # Add handoff message to the state. Command messages are built with
+            # model_construct: content and kwargs are already well-typed, so
+            # skipping pydantic validation is safe and noticeably cheaper.
+            handoff_msg = HumanMessage.model_construct(
+                content=f"Handoff from {self._source_value}: {self.handoff_message}",
                 additional_kwargs={
                     "command_id": self.command_id,
                     "handoff_data": self.handoff_data,
-                    "source_agent": self.source_agent.value,
-                    "target_agent": self.target_agent.value
+                    "source_agent": self._source_value,
+                    "target_agent": self._target_value
                 }
             )
             
             state.add_agent_message(self.target_agent, handoff_msg)
             
             # Determine next workflow stage based on target agent
-            stage_mapping = {
-                AgentRole.WORKSPACE: WorkflowStage.WORKSPACE_ANALYSIS,
-                AgentRole.PLANNING: WorkflowStage.PLANNING,
-                AgentRole.INSIGHTS: WorkflowStage.INSIGHTS_GENERATION,
-                AgentRole.SUPERVISOR: WorkflowStage.SUPERVISOR_REVIEW
-            }
-            
-            if self.target_agent in stage_mapping:
-                state.transition_to_stage(stage_mapping[self.target_agent], self.target_agent)
+            stage = _TARGET_TO_STAGE.get(self.target_agent)
+            if stage is not None:
+                state.transition_to_stage(stage, self.target_agent)
             
             self.status = "completed"
-            self.completed_at = datetime.now()
+            self._completed_ns = time.time_ns()
             self.result = {
-                "target_agent": self.target_agent.value,
+                "target_agent": self._target_value,
                 "handoff_successful": True,
-                "handoff_time": self.completed_at.isoformat()
+                "handoff_time": _ns_to_datetime(self._completed_ns).isoformat()
             }
             
             return self.result
@@ -157,14 +258,14 @@ class AgentHandoffCommand(CommandInterface):
         except Exception as e:
             self.status = "failed"
             self.error = str(e)
-            self.completed_at = datetime.now()
-            logger.error(f"Handoff command failed: {e}")
+            self._completed_ns = time.time_ns()
+            logger.error("Handoff command failed: %s", e)
             raise
     
     async def undo(self, state: AgentState) -> Dict[str, Any]:
         """Undo the handoff (return control to source agent)."""
         state.next_agent = self.source_agent
-        return {"handoff_undone": True, "returned_to": self.source_agent.value}
+        return {"handoff_undone": True, "returned_to": self._source_value}
 
 
 class DataRequestCommand(CommandInterface):
@@ -181,22 +282,34 @@ class DataRequestCommand(CommandInterface):
         super().__init__(command_type=CommandType.DATA_REQUEST, **kwargs)
         self.target_agent = target_agent
         self.source_agent = source_agent
+        self._target_value = target_agent.value
+        self._source_value = source_agent.value
         self.data_request = data_request
         self.request_params = request_params or {}
     
+    def coalesce_key(self) -> Optional[tuple]:
+        """Identical data requests to the same agent only need to be sent once."""
+        return (
+            self.command_type,
+            self.target_agent,
+            self.source_agent,
+            self.data_request,
+            repr(self.request_params)
+        )
+    
     async def execute(self, state: AgentState) -> Dict[str, Any]:
         """Execute the data request command."""
         try:
-            self.executed_at = datetime.now()
+            self._executed_ns = time.time_ns()
             self.status = "executing"
             
             # Create data request message
-            request_msg = HumanMessage(
-                content=f"Data request from {self.source_agent.value}: {self.data_request}",
+            request_msg = HumanMessage.model_construct(
+                content=f"Data request from {self._source_value}: {self.data_request}",
                 additional_kwargs={
                     "command_id": self.command_id,
                     "request_params": self.request_params,
-                    "source_agent": self.source_agent.value,
+                    "source_agent": self._source_value,
                     "request_type": "data_request"
                 }
             )
@@ -204,10 +317,10 @@ class DataRequestCommand(CommandInterface):
             state.add_agent_message(self.target_agent, request_msg)
             
             self.status = "completed"
-            self.completed_at = datetime.now()
+            self._completed_ns = time.time_ns()
             self.result = {
                 "request_sent": True,
-                "target_agent": self.target_agent.value,
+                "target_agent": self._target_value,
                 "request_id": self.command_id
             }
             
@@ -216,8 +329,8 @@ class DataRequestCommand(CommandInterface):
         except Exception as e:
             self.status = "failed"
             self.error = str(e)
-            self.completed_at = datetime.now()
-            logger.error(f"Data request command failed: {e}")
+            self._completed_ns = time.time_ns()
+            logger.error("Data request command failed: %s", e)
             raise
     
     async def undo(self, state: AgentState) -> Dict[str, Any]:
@@ -239,6 +352,7 @@ class TaskAssignmentCommand(CommandInterface):
     ):
         super().__init__(command_type=CommandType.TASK_ASSIGNMENT, **kwargs)
         self.target_agent = target_agent
+        self._target_value = target_agent.value
         self.task_description = task_description
         self.task_params = task_params or {}
         self.dependencies = dependencies or []
@@ -246,7 +360,7 @@ class TaskAssignmentCommand(CommandInterface):
     async def execute(self, state: AgentState) -> Dict[str, Any]:
         """Execute the task assignment command."""
         try:
-            self.executed_at = datetime.now()
+            self._executed_ns = time.time_ns()
             self.status = "executing"
             
             # Create agent task
@@ -261,7 +375,7 @@ class TaskAssignmentCommand(CommandInterface):
             state.add_task(task)
             
             # Create task assignment message
-            assignment_msg = HumanMessage(
+            assignment_msg = HumanMessage.model_construct(
                 content=f"Task assigned: {self.task_description}",
                 additional_kwargs={
                     "command_id": self.command_id,
@@ -275,11 +389,11 @@ class TaskAssignmentCommand(CommandInterface):
             state.add_agent_message(self.target_agent, assignment_msg)
             
             self.status = "completed"
-            self.completed_at = datetime.now()
+            self._completed_ns = time.time_ns()
             self.result = {
                 "task_assigned": True,
                 "task_id": task.id,
-                "target_agent": self.target_agent.value
+                "target_agent": self._target_value
             }
             
             return self.result
@@ -287,14 +401,14 @@ class TaskAssignmentCommand(CommandInterface):
         except Exception as e:
             self.status = "failed"
             self.error = str(e)
-            self.completed_at = datetime.now()
-            logger.error(f"Task assignment command failed: {e}")
+            self._completed_ns = time.time_ns()
+            logger.error("Task assignment command failed: %s", e)
             raise
     
     async def undo(self, state: AgentState) -> Dict[str, Any]:
         """Undo task assignment (cancel the task)."""
         # Remove task from active tasks
-        state.active_tasks = [t for t in state.active_tasks if t.id != self.command_id]
+        state.active_tasks.pop(self.command_id, None)
         return {"task_cancelled": True}
 
 
@@ -312,25 +426,27 @@ class ResultDeliveryCommand(CommandInterface):
         super().__init__(command_type=CommandType.RESULT_DELIVERY, **kwargs)
         self.target_agent = target_agent
         self.source_agent = source_agent
+        self._target_value = target_agent.value
+        self._source_value = source_agent.value
         self.result_data = result_data
         self.result_summary = result_summary
     
     async def execute(self, state: AgentState) -> Dict[str, Any]:
         """Execute the result delivery command."""
         try:
-            self.executed_at = datetime.now()
+            self._executed_ns = time.time_ns()
             self.status = "executing"
             
             # Store result in state
             state.set_agent_result(self.source_agent, self.result_data)
             
             # Create result delivery message
-            result_msg = AIMessage(
-                content=f"Results from {self.source_agent.value}: {self.result_summary}",
+            result_msg = AIMessage.model_construct(
+                content=f"Results from {self._source_value}: {self.result_summary}",
                 additional_kwargs={
                     "command_id": self.command_id,
                     "result_data": self.result_data,
-                    "source_agent": self.source_agent.value,
+                    "source_agent": self._source_value,
                     "delivery_type": "result_delivery"
                 }
             )
@@ -338,11 +454,11 @@ class ResultDeliveryCommand(CommandInterface):
             state.add_agent_message(self.target_agent, result_msg)
             
             self.status = "completed"
-            self.completed_at = datetime.now()
+            self._completed_ns = time.time_ns()
             self.result = {
                 "result_delivered": True,
-                "target_agent": self.target_agent.value,
-                "source_agent": self.source_agent.value
+                "target_agent": self._target_value,
+                "source_agent": self._source_value
             }
             
             return self.result
@@ -350,8 +466,8 @@ class ResultDeliveryCommand(CommandInterface):
         except Exception as e:
             self.status = "failed"
             self.error = str(e)
-            self.completed_at = datetime.now()
-            logger.error(f"Result delivery command failed: {e}")
+            self._completed_ns = time.time_ns()
+            logger.error("Result delivery command failed: %s", e)
             raise
     
     async def undo(self, state: AgentState) -> Dict[str, Any]:
@@ -375,24 +491,24 @@ class WorkflowControlCommand(CommandInterface):
     async def execute(self, state: AgentState) -> Dict[str, Any]:
         """Execute the workflow control command."""
         try:
-            self.executed_at = datetime.now()
+            self._executed_ns = time.time_ns()
             self.status = "executing"
             
             if self.control_action == "complete":
                 state.transition_to_stage(WorkflowStage.COMPLETE)
             elif self.control_action == "reset":
                 state.transition_to_stage(WorkflowStage.WORKSPACE_ANALYSIS, AgentRole.WORKSPACE)
-                state.active_tasks = []
+                state.active_tasks = {}
                 state.failed_tasks = []
             elif self.control_action == "pause":
                 state.execution_context["paused"] = True
-                state.execution_context["pause_time"] = datetime.now().isoformat()
+                state.execution_context["pause_time"] = _ns_to_datetime(self._executed_ns).isoformat()
             elif self.control_action == "resume":
                 state.execution_context["paused"] = False
-                state.execution_context["resume_time"] = datetime.now().isoformat()
+                state.execution_context["resume_time"] = _ns_to_datetime(self._executed_ns).isoformat()
             
             self.status = "completed"
-            self.completed_at = datetime.now()
+            self._completed_ns = time.time_ns()
             self.result = {
                 "control_action": self.control_action,
                 "action_successful": True
@@ -403,8 +519,8 @@ class WorkflowControlCommand(CommandInterface):
         except Exception as e:
             self.status = "failed"
             self.error = str(e)
-            self.completed_at = datetime.now()
-            logger.error(f"Workflow control command failed: {e}")
+            self._completed_ns = time.time_ns()
+            logger.error("Workflow control command failed: %s", e)
             raise
     
     async def undo(self, state: AgentState) -> Dict[str, Any]:
@@ -412,25 +528,103 @@ class WorkflowControlCommand(CommandInterface):
         return {"workflow_control_undo": "implementation_dependent"}
 
 
+class CommandBatch:
+    """
+    Runs a group of independent commands concurrently against one state.
+    
+    Commands with the same coalesce_key() are executed once, and every
+    duplicate is marked with that command's outcome. Commands must not
+    depend on each other's effects, since they may run in any order.
+    """
+    
+    def __init__(self, commands: Optional[List[CommandInterface]] = None):
+        self.commands: List[CommandInterface] = list(commands or [])
+    
+    def add(self, command: CommandInterface) -> None:
+        """Add a command to the batch."""
+        self.commands.append(command)
+    
+    def __len__(self) -> int:
+        return len(self.commands)
+    
+    async def execute_all(
+        self,
+        state: AgentState,
+        max_concurrent: int = 32
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute the batch with at most max_concurrent commands in flight.
+        
+        Returns a dict mapping each command ID, in batch order, to its
+        result. A command that raised maps to an error dict instead, after
+        recording the failure on the command as usual.
+        """
+        # Group duplicates behind the first command with each coalesce key
+        leaders: List[CommandInterface] = []
+        followers: Dict[str, List[CommandInterface]] = {}
+        leader_by_key: Dict[tuple, CommandInterface] = {}
+        for command in self.commands:
+            key = command.coalesce_key()
+            leader = leader_by_key.get(key) if key is not None else None
+            if leader is None:
+                leaders.append(command)
+                followers[command.command_id] = []
+                if key is not None:
+                    leader_by_key[key] = command
+            else:
+                followers[leader.command_id].append(command)
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def run(command: CommandInterface) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await command.execute(state)
+                except Exception as e:
+                    logger.error("Batched command %s failed: %s", command.command_id, e)
+                    return {"error": str(e), "command_id": command.command_id}
+        
+        results = await asyncio.gather(*(run(command) for command in leaders))
+        
+        results_by_id: Dict[str, Dict[str, Any]] = {}
+        for leader, result in zip(leaders, results):
+            results_by_id[leader.command_id] = result
+            for follower in followers[leader.command_id]:
+                # Duplicates share the executed command's outcome
+                follower.status = leader.status
+                follower.result = leader.result
+                follower.error = leader.error
+                follower._executed_ns = leader._executed_ns
+                follower._completed_ns = leader._completed_ns
+                results_by_id[follower.command_id] = result
+        
+        if len(leaders) < len(self.commands):
+            logger.info("Coalesced %d duplicate commands", len(self.commands) - len(leaders))
+        
+        return {command.command_id: results_by_id[command.command_id] for command in self.commands}
+
+
+# Command classes created by create_command, by command type
+_COMMAND_MAP: Mapping[CommandType, Type[CommandInterface]] = MappingProxyType({
+    CommandType.HANDOFF: AgentHandoffCommand,
+    CommandType.DATA_REQUEST: DataRequestCommand,
+    CommandType.TASK_ASSIGNMENT: TaskAssignmentCommand,
+    CommandType.RESULT_DELIVERY: ResultDeliveryCommand,
+    CommandType.WORKFLOW_CONTROL: WorkflowControlCommand,
+})
+
+
 # Factory function for creating commands
 def create_command(
     command_type: CommandType,
     **kwargs
 ) -> CommandInterface:
     """Factory function to create commands of different types."""
-    
-    command_map = {
-        CommandType.HANDOFF: AgentHandoffCommand,
-        CommandType.DATA_REQUEST: DataRequestCommand,
-        CommandType.TASK_ASSIGNMENT: TaskAssignmentCommand,
-        CommandType.RESULT_DELIVERY: ResultDeliveryCommand,
-        CommandType.WORKFLOW_CONTROL: WorkflowControlCommand,
-    }
-    
-    if command_type not in command_map:
+    command_class = _COMMAND_MAP.get(command_type)
+    if command_class is None:
         raise ValueError(f"Unknown command type: {command_type}")
     
-    return command_map[command_type](**kwargs)
+    return command_class(**kwargs)
 
 
 # Aliases for common command patterns
@@ -5,16 +5,25 @@ Defines the shared state structure used across agents in the StateGraph.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Annotated
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, Deque, List, Optional, Annotated
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from langgraph.graph import MessagesState
+from langgraph.graph.message import add_messages
 from langchain.schema import BaseMessage
+from langchain_core.messages import AnyMessage
 
 logger = logging.getLogger(__name__)
 
+# Most recent messages and errors kept per agent; older entries are dropped
+# and counted in AgentState.dropped_agent_messages / dropped_agent_errors
+MAX_AGENT_MESSAGES = 1024
+MAX_AGENT_ERRORS = 1024
+
 
 class WorkflowStage(str, Enum):
     """Stages in the campaign planning workflow."""
@@ -43,18 +52,33 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class AgentTask(BaseModel):
-    """Individual task assigned to an agent."""
+@dataclass(slots=True)
+class AgentTask:
+    """
+    Individual task assigned to an agent.
+    
+    Tasks are created internally from already-typed values, so this is a
+    slotted dataclass rather than a validating model. Use from_dict() for
+    untrusted input such as deserialized JSON.
+    """
     id: str
     agent_role: AgentRole
     description: str
     status: TaskStatus = TaskStatus.PENDING
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
-    dependencies: List[str] = Field(default_factory=list)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    dependencies: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentTask":
+        """Build a task from external data, validating and coercing its fields."""
+        return _agent_task_adapter.validate_python(data)
+
+
+_agent_task_adapter = TypeAdapter(AgentTask)
 
 
 class WorkspaceData(BaseModel):
@@ -85,23 +109,41 @@ class InsightsData(BaseModel):
     predictive_insights: Optional[Dict[str, Any]] = None
 
 
-class AgentState(MessagesState):
+def _agent_message_buffers() -> Dict[AgentRole, Deque[BaseMessage]]:
+    """Create a bounded message buffer for every agent role."""
+    return {role: deque(maxlen=MAX_AGENT_MESSAGES) for role in AgentRole}
+
+
+def _agent_error_buffers() -> Dict[AgentRole, Deque[str]]:
+    """Create a bounded error buffer for every agent role."""
+    return {role: deque(maxlen=MAX_AGENT_ERRORS) for role in AgentRole}
+
+
+class AgentState(BaseModel):
     """
-    Enhanced state model that extends LangGraph's MessagesState
-    for multi-agent coordination.
+    Shared state model for multi-agent coordination.
+    
+    Carries the same add_messages ``messages`` channel as LangGraph's
+    MessagesState, so the graph can use it directly as its state schema.
     """
     
+    messages: Annotated[List[AnyMessage], add_messages] = Field(default_factory=list)
+    
     # Workflow coordination
     current_stage: WorkflowStage = WorkflowStage.WORKSPACE_ANALYSIS
     next_agent: Optional[AgentRole] = None
-    active_tasks: List[AgentTask] = Field(default_factory=list)
+    active_tasks: Dict[str, AgentTask] = Field(default_factory=dict)  # Keyed by task ID
     completed_tasks: List[AgentTask] = Field(default_factory=list)
     failed_tasks: List[AgentTask] = Field(default_factory=list)
     
     # Agent communication
-    agent_messages: Dict[AgentRole, List[BaseMessage]] = Field(default_factory=dict)
+    agent_messages: Dict[AgentRole, Deque[BaseMessage]] = Field(default_factory=_agent_message_buffers)
     agent_results: Dict[AgentRole, Dict[str, Any]] = Field(default_factory=dict)
-    agent_errors: Dict[AgentRole, List[str]] = Field(default_factory=dict)
+    agent_result_versions: Dict[AgentRole, int] = Field(default_factory=dict)  # Bumped on every set_agent_result
+    agent_errors: Dict[AgentRole, Deque[str]] = Field(default_factory=_agent_error_buffers)
+    dropped_agent_messages: Dict[AgentRole, int] = Field(default_factory=dict)
+    dropped_agent_errors: Dict[AgentRole, int] = Field(default_factory=dict)
+    error_count: int = 0  # All errors ever added, including dropped ones
     
     # Business context
     tenant_id: Optional[str] = None
@@ -125,61 +167,77 @@ class AgentState(MessagesState):
     
     def add_agent_message(self, agent_role: AgentRole, message: BaseMessage):
         """Add a message from a specific agent."""
-        if agent_role not in self.agent_messages:
-            self.agent_messages[agent_role] = []
-        self.agent_messages[agent_role].append(message)
+        buffer = self.agent_messages[agent_role]
+        self._count_eviction(buffer, self.dropped_agent_messages, agent_role, "message")
+        buffer.append(message)
         self.last_activity_time = datetime.now()
     
     def set_agent_result(self, agent_role: AgentRole, result: Dict[str, Any]):
-        """Set the result from a specific agent."""
+        """Set the result from a specific agent, replacing any earlier one."""
         self.agent_results[agent_role] = result
+        self.agent_result_versions[agent_role] = self.agent_result_versions.get(agent_role, 0) + 1
         self.last_activity_time = datetime.now()
     
     def add_agent_error(self, agent_role: AgentRole, error: str):
         """Add an error from a specific agent."""
-        if agent_role not in self.agent_errors:
-            self.agent_errors[agent_role] = []
-        self.agent_errors[agent_role].append(error)
+        buffer = self.agent_errors[agent_role]
+        self._count_eviction(buffer, self.dropped_agent_errors, agent_role, "error")
+        buffer.append(error)
+        self.error_count += 1
         self.last_activity_time = datetime.now()
     
+    def _count_eviction(self, buffer: Deque, dropped: Dict[AgentRole, int], agent_role: AgentRole, kind: str):
+        """Count the entry a full buffer is about to drop, warning on the first one."""
+        if buffer.maxlen is None or len(buffer) < buffer.maxlen:
+            return
+        dropped[agent_role] = dropped.get(agent_role, 0) + 1
+        if dropped[agent_role] == 1:
+            logger.warning(
+                "%s %s buffer is full (%d); dropping its oldest entries",
+                agent_role.value, kind, buffer.maxlen
+            )
+    
     def transition_to_stage(self, stage: WorkflowStage, next_agent: Optional[AgentRole] = None):
         """Transition the workflow to a new stage."""
         self.current_stage = stage
         self.next_agent = next_agent
         self.last_activity_time = datetime.now()
         
-        logger.info(f"Workflow transitioned to stage: {stage.value}")
+        logger.info("Workflow transitioned to stage: %s", stage.value)
         if next_agent:
-            logger.info(f"Next agent: {next_agent.value}")
+            logger.info("Next agent: %s", next_agent.value)
+    
+    @property
+    def active_tasks_list(self) -> List[AgentTask]:
+        """Active tasks in the order they were added."""
+        return list(self.active_tasks.values())
     
     def add_task(self, task: AgentTask):
         """Add a new task to the active tasks."""
-        self.active_tasks.append(task)
+        self.active_tasks[task.id] = task
         self.last_activity_time = datetime.now()
     
     def complete_task(self, task_id: str, result: Optional[Dict[str, Any]] = None):
         """Mark a task as completed."""
-        for i, task in enumerate(self.active_tasks):
-            if task.id == task_id:
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.now()
-                task.result = result
-                completed_task = self.active_tasks.pop(i)
-                self.completed_tasks.append(completed_task)
-                self.last_activity_time = datetime.now()
-                break
+        task = self.active_tasks.pop(task_id, None)
+        if task is not None:
+            now = datetime.now()
+            task.status = TaskStatus.COMPLETED
+            task.completed_at = now
+            task.result = result
+            self.completed_tasks.append(task)
+            self.last_activity_time = now
     
     def fail_task(self, task_id: str, error: str):
         """Mark a task as failed."""
-        for i, task in enumerate(self.active_tasks):
-            if task.id == task_id:
-                task.status = TaskStatus.FAILED
-                task.error = error
-                task.completed_at = datetime.now()
-                failed_task = self.active_tasks.pop(i)
-                self.failed_tasks.append(failed_task)
-                self.last_activity_time = datetime.now()
-                break
+        task = self.active_tasks.pop(task_id, None)
+        if task is not None:
+            now = datetime.now()
+            task.status = TaskStatus.FAILED
+            task.error = error
+            task.completed_at = now
+            self.failed_tasks.append(task)
+            self.last_activity_time = now
     
     def get_workflow_summary(self) -> Dict[str, Any]:
         """Get a summary of the current workflow state."""
@@ -191,7 +249,18 @@ class AgentState(MessagesState):
             "failed_tasks_count": len(self.failed_tasks),
             "workflow_duration": (datetime.now() - self.workflow_start_time).total_seconds(),
             "last_activity": self.last_activity_time.isoformat(),
-            "has_errors": bool(self.agent_errors)
+            "has_errors": self.error_count > 0,
+            "error_count": self.error_count,
+            "dropped_messages_count": sum(self.dropped_agent_messages.values()),
+            "dropped_errors_count": sum(self.dropped_agent_errors.values())
+        }
+    
+    def final_snapshot(self) -> Dict[str, Any]:
+        """Dump the workspace, planning and insights outputs as plain dicts."""
+        return {
+            "workspace_data": self.workspace_data.model_dump(),
+            "campaign_plan": self.campaign_plan.model_dump(),
+            "insights_data": self.insights_data.model_dump()
         }
 
 
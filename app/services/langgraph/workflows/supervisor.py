@@ -5,8 +5,13 @@ Implements the StateGraph and orchestrates the multi-agent workflow for
 intelligent campaign planning using LangGraph's StateGraph and Command patterns.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Literal
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import AsyncIterator, Deque, Dict, Any, List, Optional, Literal, Mapping
 from datetime import datetime
 
 from langgraph.graph import StateGraph, START, END
@@ -20,13 +25,41 @@ from .state_models import (
 from .commands import (
     CommandInterface, AgentHandoffCommand, DataRequestCommand,
     TaskAssignmentCommand, ResultDeliveryCommand, WorkflowControlCommand,
-    create_command, CommandType
+    CommandBatch, create_command, CommandType, _ns_to_datetime
 )
 # NOTE: Removed circular import - agents will be injected
 # from ..agents import WorkspaceAgent, PlanningAgent, InsightsAgent, SupervisorAgent
 
 logger = logging.getLogger(__name__)
 
+# Graph route taken for each supervisor next_action; unknown actions complete
+_SUPERVISOR_ROUTES: Mapping[str, Literal["workspace", "planning", "insights", "complete"]] = MappingProxyType({
+    "complete": "complete",
+    "retry_workspace": "workspace",
+    "retry_planning": "planning",
+    "retry_insights": "insights"
+})
+
+# Completion score indexed by a bitmask of finished stages:
+# workspace = 1 (0.3), planning = 2 (0.4), insights = 4 (0.3)
+_COMPLETION_SCORES = (0.0, 0.3, 0.4, 0.7, 0.3, 0.6, 0.7, 1.0)
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionRecord:
+    """One executed command in SupervisorWorkflow.execution_history."""
+    command_id: str
+    command_type: str
+    timestamp_ns: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the record, formatting its timestamp as ISO 8601."""
+        return {
+            "command_id": self.command_id,
+            "command_type": self.command_type,
+            "timestamp": _ns_to_datetime(self.timestamp_ns).isoformat()
+        }
+
 
 class SupervisorWorkflow:
     """
@@ -39,8 +72,8 @@ class SupervisorWorkflow:
         self.graph: Optional[StateGraph] = None
         self.compiled_graph = None
         self.agents: Dict[AgentRole, Any] = {}
-        self.command_queue: List[CommandInterface] = []
-        self.execution_history: List[Dict[str, Any]] = []
+        self.command_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.get("queue_max", 1024))
+        self.execution_history: Deque[ExecutionRecord] = deque(maxlen=self.config.get("history_max", 10_000))
         
         # Initialize the workflow (agents will be injected later)
         self._initialize_agents()
@@ -161,13 +194,11 @@ class SupervisorWorkflow:
             state.set_agent_result(AgentRole.WORKSPACE, workspace_results)
             
             # Add completion message
-            completion_msg = HumanMessage(
-                content="Workspace analysis completed successfully",
-                additional_kwargs={
-                    "agent": AgentRole.WORKSPACE.value,
-                    "results": workspace_results,
-                    "stage": WorkflowStage.WORKSPACE_ANALYSIS.value
-                }
+            completion_msg = self._completion_message(
+                state,
+                AgentRole.WORKSPACE,
+                WorkflowStage.WORKSPACE_ANALYSIS,
+                "Workspace analysis completed successfully"
             )
             state.messages.append(completion_msg)
             
@@ -201,13 +232,11 @@ class SupervisorWorkflow:
             state.set_agent_result(AgentRole.PLANNING, planning_results)
             
             # Add completion message
-            completion_msg = HumanMessage(
-                content="Campaign planning completed successfully",
-                additional_kwargs={
-                    "agent": AgentRole.PLANNING.value,
-                    "results": planning_results,
-                    "stage": WorkflowStage.PLANNING.value
-                }
+            completion_msg = self._completion_message(
+                state,
+                AgentRole.PLANNING,
+                WorkflowStage.PLANNING,
+                "Campaign planning completed successfully"
             )
             state.messages.append(completion_msg)
             
@@ -243,13 +272,11 @@ class SupervisorWorkflow:
             state.set_agent_result(AgentRole.INSIGHTS, insights_results)
             
             # Add completion message
-            completion_msg = HumanMessage(
-                content="Insights generation completed successfully",
-                additional_kwargs={
-                    "agent": AgentRole.INSIGHTS.value,
-                    "results": insights_results,
-                    "stage": WorkflowStage.INSIGHTS_GENERATION.value
-                }
+            completion_msg = self._completion_message(
+                state,
+                AgentRole.INSIGHTS,
+                WorkflowStage.INSIGHTS_GENERATION,
+                "Insights generation completed successfully"
             )
             state.messages.append(completion_msg)
             
@@ -270,24 +297,23 @@ class SupervisorWorkflow:
             state.transition_to_stage(WorkflowStage.SUPERVISOR_REVIEW, AgentRole.SUPERVISOR)
             
             # Supervisor logic to determine next steps
+            completion_score = self._calculate_completion_score(state)
             supervisor_results = {
                 "workflow_reviewed": True,
                 "quality_check": "passed",
-                "next_action": self._determine_next_action(state),
-                "completion_score": self._calculate_completion_score(state)
+                "next_action": self._determine_next_action(state, completion_score),
+                "completion_score": completion_score
             }
             
             # Store results in state
             state.set_agent_result(AgentRole.SUPERVISOR, supervisor_results)
             
             # Add completion message
-            completion_msg = HumanMessage(
-                content=f"Supervisor review completed: {supervisor_results['next_action']}",
-                additional_kwargs={
-                    "agent": AgentRole.SUPERVISOR.value,
-                    "results": supervisor_results,
-                    "stage": WorkflowStage.SUPERVISOR_REVIEW.value
-                }
+            completion_msg = self._completion_message(
+                state,
+                AgentRole.SUPERVISOR,
+                WorkflowStage.SUPERVISOR_REVIEW,
+                f"Supervisor review completed: {supervisor_results['next_action']}"
             )
             state.messages.append(completion_msg)
             
@@ -312,11 +338,7 @@ class SupervisorWorkflow:
                 "workflow_completed": True,
                 "completion_time": datetime.now().isoformat(),
                 "summary": state.get_workflow_summary(),
-                "final_outputs": {
-                    "workspace_data": state.workspace_data.dict() if state.workspace_data else {},
-                    "campaign_plan": state.campaign_plan.dict() if state.campaign_plan else {},
-                    "insights_data": state.insights_data.dict() if state.insights_data else {}
-                }
+                "final_outputs": state.final_snapshot()
             }
             
             # Add final message
@@ -337,6 +359,24 @@ class SupervisorWorkflow:
             state.transition_to_stage(WorkflowStage.ERROR)
             return {"completion_status": "error", "error": str(e)}
     
+    def _completion_message(
+        self,
+        state: CampaignPlanningState,
+        agent: AgentRole,
+        stage: WorkflowStage,
+        content: str
+    ) -> HumanMessage:
+        """Build a completion message referencing the agent's versioned results."""
+        return HumanMessage.model_construct(
+            content=content,
+            additional_kwargs={
+                "agent": agent.value,
+                "result_ref": agent.value,
+                "result_version": state.agent_result_versions.get(agent, 0),
+                "stage": stage.value
+            }
+        )
+    
     # Routing functions for conditional edges
     def _route_from_workspace(self, state: CampaignPlanningState) -> Literal["planning", "supervisor", "error"]:
         """Determine routing from workspace agent."""
@@ -377,22 +417,16 @@ class SupervisorWorkflow:
         
         # Get supervisor's decision
         supervisor_results = state.agent_results.get(AgentRole.SUPERVISOR, {})
-        next_action = supervisor_results.get("next_action", "complete")
-        
-        if next_action == "complete":
-            return "complete"
-        elif next_action == "retry_workspace":
-            return "workspace"
-        elif next_action == "retry_planning":
-            return "planning"
-        elif next_action == "retry_insights":
-            return "insights"
-        else:
-            return "complete"
+        return _SUPERVISOR_ROUTES.get(supervisor_results.get("next_action", "complete"), "complete")
     
-    def _determine_next_action(self, state: CampaignPlanningState) -> str:
+    def _determine_next_action(
+        self,
+        state: CampaignPlanningState,
+        completion_score: Optional[float] = None
+    ) -> str:
         """Determine the next action based on current workflow state."""
-        completion_score = self._calculate_completion_score(state)
+        if completion_score is None:
+            completion_score = self._calculate_completion_score(state)
         
         if completion_score >= 0.9:
             return "complete"
@@ -412,25 +446,12 @@ class SupervisorWorkflow:
     
     def _calculate_completion_score(self, state: CampaignPlanningState) -> float:
         """Calculate workflow completion score."""
-        score = 0.0
-        total_checks = 0
-        
-        # Check workspace completion
-        if state.workspace_data.google_sheets_data:
-            score += 0.3
-        total_checks += 0.3
-        
-        # Check planning completion
-        if state.campaign_plan.budget_allocation:
-            score += 0.4
-        total_checks += 0.4
-        
-        # Check insights completion
-        if state.insights_data.performance_metrics:
-            score += 0.3
-        total_checks += 0.3
-        
-        return score / total_checks if total_checks > 0 else 0.0
+        completed = (
+            bool(state.workspace_data.google_sheets_data)
+            | bool(state.campaign_plan.budget_allocation) << 1
+            | bool(state.insights_data.performance_metrics) << 2
+        )
+        return _COMPLETION_SCORES[completed]
     
     # Command execution methods
     async def execute_command(self, command: CommandInterface, state: CampaignPlanningState) -> Dict[str, Any]:
@@ -439,11 +460,11 @@ class SupervisorWorkflow:
             logger.info(f"Executing command: {command.command_type.value}")
             
             # Add command to execution history
-            self.execution_history.append({
-                "command_id": command.command_id,
-                "command_type": command.command_type.value,
-                "timestamp": datetime.now().isoformat()
-            })
+            self.execution_history.append(ExecutionRecord(
+                command.command_id,
+                command.command_type.value,
+                time.time_ns()
+            ))
             
             # Execute the command
             result = await command.execute(state)
@@ -455,6 +476,28 @@ class SupervisorWorkflow:
             logger.error(f"Command execution failed: {e}")
             raise
     
+    async def execute_queued_commands(
+        self,
+        state: CampaignPlanningState,
+        max_concurrent: int = 32
+    ) -> Dict[str, Dict[str, Any]]:
+        """Execute all queued commands as one concurrent batch and clear the queue."""
+        batch = CommandBatch()
+        while not self.command_queue.empty():
+            batch.add(self.command_queue.get_nowait())
+            self.command_queue.task_done()
+        if not batch:
+            return {}
+        
+        logger.info(f"Executing {len(batch)} queued commands")
+        timestamp_ns = time.time_ns()
+        self.execution_history.extend(
+            ExecutionRecord(command.command_id, command.command_type.value, timestamp_ns)
+            for command in batch.commands
+        )
+        
+        return await batch.execute_all(state, max_concurrent=max_concurrent)
+    
     async def handoff_to_agent(
         self,
         target_agent: AgentRole,
@@ -463,7 +506,12 @@ class SupervisorWorkflow:
         data: Optional[Dict[str, Any]] = None,
         state: Optional[CampaignPlanningState] = None
     ) -> Dict[str, Any]:
-        """Create and execute a handoff command."""
+        """
+        Create and execute a handoff command.
+        
+        Without a state the command is queued for execute_queued_commands.
+        Raises asyncio.QueueFull once config["queue_max"] commands are waiting.
+        """
         command = AgentHandoffCommand(
             target_agent=target_agent,
             source_agent=source_agent,
@@ -475,7 +523,7 @@ class SupervisorWorkflow:
             return await self.execute_command(command, state)
         else:
             # Queue the command for later execution
-            self.command_queue.append(command)
+            self.command_queue.put_nowait(command)
             return {"command_queued": True, "command_id": command.command_id}
     
     # Main execution methods
@@ -509,20 +557,100 @@ class SupervisorWorkflow:
                 "workflow_completed": True,
                 "final_state": final_state,
                 "execution_summary": final_state.get_workflow_summary(),
-                "execution_history": self.execution_history
+                "execution_history": [record.to_dict() for record in self.execution_history]
             }
             
         except Exception as e:
             logger.error(f"Workflow execution failed: {e}")
             raise
     
+    async def stream_workflow(
+        self,
+        initial_state: Optional[CampaignPlanningState] = None,
+        config: Optional[Dict[str, Any]] = None,
+        stream_mode: str = "updates"
+    ) -> AsyncIterator[Any]:
+        """
+        Run the workflow and yield graph output as each node finishes.
+        
+        stream_mode is passed through to LangGraph ("updates", "values",
+        "messages", ...), so callers can report progress before the run ends.
+        """
+        try:
+            logger.info(f"Starting multi-agent workflow stream ({stream_mode})")
+            
+            if initial_state is None:
+                initial_state = CampaignPlanningState()
+            
+            if config:
+                initial_state.workflow_config = config
+            
+            if not self.compiled_graph:
+                raise ValueError("Workflow graph not compiled")
+            
+            async for chunk in self.compiled_graph.astream(initial_state, stream_mode=stream_mode):
+                yield chunk
+            
+            logger.info("Multi-agent workflow stream completed")
+            
+        except Exception as e:
+            logger.error(f"Workflow stream failed: {e}")
+            raise
+    
+    async def run_batch_async(
+        self,
+        initial_states: List[CampaignPlanningState],
+        config: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 8,
+        include_summary: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the workflow for many states concurrently through the compiled graph.
+        
+        Results are returned in input order. Workflow summaries are only built
+        when include_summary is set.
+        """
+        try:
+            if not self.compiled_graph:
+                raise ValueError("Workflow graph not compiled")
+            
+            if not initial_states:
+                return []
+            
+            logger.info(f"Starting batch workflow execution for {len(initial_states)} states")
+            
+            if config:
+                for state in initial_states:
+                    state.workflow_config = config
+            
+            final_states = await self.compiled_graph.abatch(
+                initial_states,
+                config={"max_concurrency": max_concurrency}
+            )
+            
+            results = []
+            for final_state in final_states:
+                result = {"workflow_completed": True, "final_state": final_state}
+                if include_summary:
+                    # LangGraph returns plain dicts; rebuild the model for its summary
+                    summary_state = CampaignPlanningState.model_validate(final_state)
+                    result["execution_summary"] = summary_state.get_workflow_summary()
+                results.append(result)
+            
+            logger.info(f"Batch workflow execution completed for {len(results)} states")
+            return results
+        
+        except Exception as e:
+            logger.error(f"Batch workflow execution failed: {e}")
+            raise
+    
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get current workflow status and metrics."""
         return {
             "graph_compiled": self.compiled_graph is not None,
             "agents_configured": len([a for a in self.agents.values() if a is not None]),
             "total_agents": len(self.agents),
-            "commands_in_queue": len(self.command_queue),
+            "commands_in_queue": self.command_queue.qsize(),
             "execution_history_length": len(self.execution_history),
             "last_updated": datetime.now().isoformat()
         } 
\ No newline at end of file
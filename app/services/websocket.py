@@ -127,6 +127,38 @@ class ConnectionManager:
                 logger.error(f"Error sending message to client {client_id}: {e}")
                 self.disconnect(client_id)
     
+    async def _send_to_clients(self, message: str, client_ids: List[str]):
+        """
+        Send one serialized message to several clients concurrently.
+        
+        Each socket is looked up once, and all recipients share a single
+        last-activity timestamp. Failed sends disconnect the client.
+        
+        Args:
+            message: JSON message string shared by every send
+            client_ids: Target client identifiers
+        """
+        targets = []
+        for client_id in client_ids:
+            websocket = self.active_connections.get(client_id)
+            if websocket is not None:
+                targets.append((client_id, websocket))
+        
+        if not targets:
+            return
+        
+        results = await asyncio.gather(*[
+            websocket.send_text(message) for _, websocket in targets
+        ], return_exceptions=True)
+        
+        now = datetime.utcnow()
+        for (client_id, _), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending message to client {client_id}: {result}")
+                self.disconnect(client_id)
+            elif client_id in self.client_sessions:
+                self.client_sessions[client_id]["last_activity"] = now
+    
     async def send_message_to_user(self, message: str, user_id: str):
         """
         Send a message to all connections for a specific user.
@@ -136,11 +168,7 @@ class ConnectionManager:
             user_id: Target user identifier
         """
         if user_id in self.user_connections:
-            client_ids = list(self.user_connections[user_id])
-            await asyncio.gather(*[
-                self.send_personal_message(message, client_id)
-                for client_id in client_ids
-            ], return_exceptions=True)
+            await self._send_to_clients(message, list(self.user_connections[user_id]))
     
     async def broadcast(self, message: str, exclude_clients: Optional[List[str]] = None):
         """
@@ -150,17 +178,13 @@ class ConnectionManager:
             message: JSON message string
             exclude_clients: List of client IDs to exclude from broadcast
         """
-        exclude_clients = exclude_clients or []
+        excluded = set(exclude_clients or ())
         client_ids = [
             client_id for client_id in self.active_connections.keys()
-            if client_id not in exclude_clients
+            if client_id not in excluded
         ]
         
-        if client_ids:
-            await asyncio.gather(*[
-                self.send_personal_message(message, client_id)
-                for client_id in client_ids
-            ], return_exceptions=True)
+        await self._send_to_clients(message, client_ids)
     
     async def broadcast_to_tenant(
         self, 
@@ -176,18 +200,14 @@ class ConnectionManager:
             tenant_id: Target tenant identifier
             exclude_clients: List of client IDs to exclude
         """
-        exclude_clients = exclude_clients or []
+        excluded = set(exclude_clients or ())
         tenant_clients = [
             client_id for client_id, session in self.client_sessions.items()
             if (session.get("session_data", {}).get("tenant_id") == tenant_id and
-                client_id not in exclude_clients)
+                client_id not in excluded)
         ]
         
-        if tenant_clients:
-            await asyncio.gather(*[
-                self.send_personal_message(message, client_id)
-                for client_id in tenant_clients
-            ], return_exceptions=True)
+        await self._send_to_clients(message, tenant_clients)
     
     def get_connection_count(self) -> int:
         """Get the total number of active connections."""
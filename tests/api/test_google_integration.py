@@ -4,8 +4,9 @@ Test Google API Integration with LangGraph Tools
 Tests for the integration between Google API clients and workspace tools.
 """
 
+import threading
 import pytest
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock, call
 from datetime import datetime
 
 from app.services.langgraph.tools.workspace_tools import (
@@ -91,6 +92,58 @@ def sample_sheet_data():
     }
 
 
+class TestGoogleAuthManager:
+    """Test GoogleAuthManager authentication checks."""
+    
+    def test_successful_authentication_check_is_reused(self, mock_settings):
+        """Test that successful checks are reused until the credentials change."""
+        auth_manager = GoogleAuthManager(mock_settings)
+        credentials = Mock(expired=False)
+        auth_manager.credentials = credentials
+        
+        with patch.object(auth_manager, "get_valid_credentials", return_value=credentials) as get_valid:
+            assert auth_manager.is_authenticated() is True
+            assert auth_manager.is_authenticated() is True
+            assert get_valid.call_count == 1
+            
+            # Clients clear credentials when Google rejects them, which forces a fresh check
+            auth_manager.credentials = None
+            get_valid.return_value = None
+            
+            assert auth_manager.is_authenticated() is False
+            assert auth_manager.is_authenticated() is False
+            assert get_valid.call_count == 3
+
+
+class TestGoogleSheetsClient:
+    """Test GoogleSheetsClient discovery helpers."""
+    
+    @pytest.mark.asyncio
+    async def test_find_campaign_sheets_async_lists_files_off_the_loop(self, mock_auth_manager, mock_settings):
+        """Test that the Drive listing runs in a worker thread on its own transport."""
+        client = GoogleSheetsClient(mock_auth_manager, mock_settings)
+        sheet_file = Mock(id="sheet1", modified_time=None)
+        sheet_file.name = "Campaign Q1 2024"
+        listing_threads = []
+        
+        def list_files(**kwargs):
+            listing_threads.append(threading.get_ident())
+            return [sheet_file]
+        
+        mock_drive_client = MagicMock(spec=GoogleDriveClient)
+        mock_drive_client.auth_manager = mock_auth_manager
+        mock_drive_client.list_files.side_effect = list_files
+        sheet_info = Mock()
+        
+        with patch.object(client, "get_spreadsheet_info_async", AsyncMock(return_value=sheet_info)):
+            result = await client.find_campaign_sheets_async(mock_drive_client)
+        
+        assert result == [sheet_info]
+        assert listing_threads != [threading.get_ident()]
+        _, kwargs = mock_drive_client.list_files.call_args
+        assert kwargs["http"] is mock_auth_manager.create_authorized_http.return_value
+
+
 class TestGoogleSheetsReader:
     """Test GoogleSheetsReader integration."""
     
@@ -114,9 +167,12 @@ class TestGoogleSheetsReader:
             mock_auth_class.return_value = mock_auth_manager
             
             reader = GoogleSheetsReader()
+            GoogleSheetsReader()
             
             assert reader.auth_manager == mock_auth_manager
             assert reader.settings == mock_settings
+            # Default-constructed tools don't share process-wide credentials
+            assert mock_auth_class.call_args_list == [call(mock_settings), call(mock_settings)]
     
     @pytest.mark.asyncio
     async def test_extract_data_success(self, mock_auth_manager, mock_settings, sample_sheet_data):
@@ -125,33 +181,25 @@ class TestGoogleSheetsReader:
         
         # Mock the private _sheets_client instead of the property
         with patch.object(reader, '_sheets_client') as mock_sheets_client:
-            # Setup mock context manager behavior
-            mock_context = MagicMock()
-            mock_sheets_client.__enter__ = Mock(return_value=mock_context)
-            mock_sheets_client.__exit__ = Mock(return_value=None)
-            
             # Setup mock sheet info
             mock_sheet_info = Mock()
             mock_sheet_info.title = "Test Campaign Sheet"
             mock_sheet_info.url = "https://docs.google.com/spreadsheets/d/test_sheet_id"
-            mock_context.get_spreadsheet_info.return_value = mock_sheet_info
+            mock_sheet_info.sheets = [{"sheet_id": 0, "title": "Sheet1", "grid_properties": {}}]
+            mock_sheets_client.get_spreadsheet_info.return_value = mock_sheet_info
             
             # Setup mock sheet data
             mock_sheet_data = Mock()
             mock_sheet_data.values = sample_sheet_data["rows"]
-            mock_context.read_range.return_value = mock_sheet_data
+            mock_header_data = Mock()
+            mock_header_data.values = sample_sheet_data["rows"][:1]
+            mock_campaign_rows = Mock()
+            mock_campaign_rows.values = sample_sheet_data["rows"][1:]
+            mock_sheets_client.batch_read.return_value = [mock_sheet_data, mock_header_data, mock_campaign_rows]
             
             # Setup mock campaign data
-            mock_campaign = Mock()
-            mock_campaign.campaign_name = "Summer Campaign"
-            mock_campaign.budget = 10000.0
-            mock_campaign.start_date = "2024-06-01"
-            mock_campaign.end_date = "2024-08-31"
-            mock_campaign.platform = "Google Ads"
-            mock_campaign.targeting = {}
-            mock_campaign.metrics = {}
-            mock_campaign.raw_row = ["Summer Campaign", "10000", "Google Ads", "2024-06-01", "2024-08-31"]
-            mock_context.parse_campaign_data.return_value = [mock_campaign]
+            campaign = CampaignData(**sample_sheet_data["parsed_campaigns"][0])
+            mock_sheets_client.parse_campaign_values.return_value = [campaign]
             
             # Execute the test
             result = await reader.extract_data("test_sheet_id", "A1:E10")
@@ -180,18 +228,14 @@ class TestGoogleSheetsReader:
         
         # Mock the private _sheets_client instead of the property
         with patch.object(reader, '_sheets_client') as mock_sheets_client:
-            mock_context = MagicMock()
-            mock_sheets_client.__enter__ = Mock(return_value=mock_context)
-            mock_sheets_client.__exit__ = Mock(return_value=None)
-            
             mock_sheet_info = Mock()
             mock_sheet_info.title = "Empty Sheet"
             mock_sheet_info.url = "https://docs.google.com/spreadsheets/d/test_sheet_id"
-            mock_context.get_spreadsheet_info.return_value = mock_sheet_info
+            mock_sheets_client.get_spreadsheet_info.return_value = mock_sheet_info
             
             mock_sheet_data = Mock()
             mock_sheet_data.values = []
-            mock_context.read_range.return_value = mock_sheet_data
+            mock_sheets_client.batch_read.return_value = [mock_sheet_data, mock_sheet_data, mock_sheet_data]
             
             result = await reader.extract_data("test_sheet_id", "A1:E10")
             
@@ -387,28 +431,27 @@ class TestGoogleAPIIntegrationWorkflow:
         
         # Mock the Google API calls
         with patch.object(sheets_reader, '_sheets_client') as mock_sheets_client:
-            mock_context = MagicMock()
-            mock_sheets_client.__enter__ = Mock(return_value=mock_context)
-            mock_sheets_client.__exit__ = Mock(return_value=None)
-            
             # Setup successful extraction
             mock_sheet_info = Mock()
             mock_sheet_info.title = sample_sheet_data["spreadsheet_title"]
-            mock_context.get_spreadsheet_info.return_value = mock_sheet_info
+            mock_sheet_info.sheets = [{"sheet_id": 0, "title": "Sheet1", "grid_properties": {}}]
+            mock_sheets_client.get_spreadsheet_info.return_value = mock_sheet_info
             
             mock_sheet_data = Mock()
             mock_sheet_data.values = sample_sheet_data["rows"]
-            mock_context.read_range.return_value = mock_sheet_data
+            mock_header_data = Mock()
+            mock_header_data.values = sample_sheet_data["rows"][:1]
+            mock_campaign_rows = Mock()
+            mock_campaign_rows.values = sample_sheet_data["rows"][1:]
+            mock_sheets_client.batch_read.return_value = [mock_sheet_data, mock_header_data, mock_campaign_rows]
             
             # Setup campaign data
-            mock_campaigns = []
-            for campaign_dict in sample_sheet_data["parsed_campaigns"]:
-                mock_campaign = Mock()
-                for key, value in campaign_dict.items():
-                    setattr(mock_campaign, key, value)
-                mock_campaigns.append(mock_campaign)
+            campaigns = [
+                CampaignData(**campaign_dict)
+                for campaign_dict in sample_sheet_data["parsed_campaigns"]
+            ]
             
-            mock_context.parse_campaign_data.return_value = mock_campaigns
+            mock_sheets_client.parse_campaign_values.return_value = campaigns
             
             # Step 1: Extract data
             extracted_data = await sheets_reader.extract_data("test_sheet_id")
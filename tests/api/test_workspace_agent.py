@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Dict, Any
 
 from app.services.langgraph.agents.workspace_agent import WorkspaceAgent
+from app.services.langgraph.base_agent import _get_llm_client, _LLM_CLIENT_CACHE_SIZE
 from app.services.langgraph.workflows.state_models import WorkspaceData, MessagesState
 from app.services.google.auth import GoogleAuthManager
 from app.core.config import Settings
@@ -141,6 +142,20 @@ class TestWorkspaceAgent:
             assert agent.auth_manager == mock_auth_manager
             mock_auth_class.assert_called_once_with(mock_settings)
     
+    def test_agents_with_same_config_share_llm_client(self, mock_auth_manager, mock_settings, monkeypatch):
+        """Test that agents with identical model settings reuse one LLM client."""
+        monkeypatch.setenv('OPENAI_API_KEY', 'test-api-key-for-testing')
+        
+        with patch('app.services.langgraph.base_agent.StateManager'), \
+             patch('app.services.langgraph.base_agent.ErrorHandler'), \
+             patch('app.services.langgraph.base_agent.ResourceManager'), \
+             patch('app.services.langgraph.base_agent.MonitoringService'):
+            first = WorkspaceAgent(auth_manager=mock_auth_manager, settings=mock_settings)
+            second = WorkspaceAgent(auth_manager=mock_auth_manager, settings=mock_settings)
+        
+        assert first.llm is second.llm
+        assert _get_llm_client.cache_info().maxsize == _LLM_CLIENT_CACHE_SIZE
+    
     @pytest.mark.asyncio
     async def test_extract_google_sheets_success(self, workspace_agent, sample_message_state, sample_extracted_data):
         """Test successful Google Sheets extraction."""
@@ -5,8 +5,9 @@ Tests for GoogleSheetsReader, FileParser, DataValidator, and WorkspaceManager
 with real Google API integration patterns and comprehensive coverage.
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock, call
 from datetime import datetime
 from typing import Dict, Any
 
@@ -83,6 +84,26 @@ class TestGoogleSheetsReader:
             )
         ]
     
+    @pytest.fixture
+    def mock_sheets_client(self, sheets_reader, sample_sheet_data, sample_campaign_data):
+        """MagicMock sheets client on the reader, serving the sample data from "Sheet1"."""
+        mock_sheets_client = MagicMock(spec=GoogleSheetsClient)
+        mock_sheet_info = Mock()
+        mock_sheet_info.title = "Campaign Planning 2024"
+        mock_sheet_info.url = "https://docs.google.com/spreadsheets/d/test_sheet_id_123"
+        mock_sheet_info.sheets = [{"sheet_id": 0, "title": "Sheet1", "grid_properties": {}}]
+        
+        mock_sheets_client.get_spreadsheet_info.return_value = mock_sheet_info
+        mock_sheets_client.batch_read.return_value = [
+            Mock(values=sample_sheet_data["values"]),
+            Mock(values=sample_sheet_data["values"][:1]),
+            Mock(values=sample_sheet_data["values"][1:])
+        ]
+        mock_sheets_client.parse_campaign_values.return_value = sample_campaign_data
+        
+        sheets_reader._sheets_client = mock_sheets_client
+        return mock_sheets_client
+    
     @pytest.mark.asyncio
     async def test_initialization(self, mock_auth_manager, mock_settings):
         """Test proper initialization of GoogleSheetsReader."""
@@ -104,10 +125,15 @@ class TestGoogleSheetsReader:
         mock_sheet_info = Mock()
         mock_sheet_info.title = "Campaign Planning 2024"
         mock_sheet_info.url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+        mock_sheet_info.sheets = [{"sheet_id": 0, "title": "Sheet1", "grid_properties": {}}]
         
         mock_sheets_client.get_spreadsheet_info.return_value = mock_sheet_info
-        mock_sheets_client.read_range.return_value = Mock(values=sample_sheet_data["values"])
-        mock_sheets_client.parse_campaign_data.return_value = sample_campaign_data
+        mock_sheets_client.batch_read.return_value = [
+            Mock(values=sample_sheet_data["values"]),
+            Mock(values=sample_sheet_data["values"][:1]),
+            Mock(values=sample_sheet_data["values"][1:])
+        ]
+        mock_sheets_client.parse_campaign_values.return_value = sample_campaign_data
         mock_sheets_client.__enter__.return_value = mock_sheets_client
         mock_sheets_client.__exit__.return_value = None
         
@@ -130,6 +156,78 @@ class TestGoogleSheetsReader:
         assert campaign["campaign_name"] == "Summer Sale"
         assert campaign["budget"] == 50000.0
         assert campaign["platform"] == "Google Ads"
+        
+        # Range, headers and campaign rows are fetched in a single batchGet
+        # on a transport created for the worker thread
+        worker_http = sheets_reader.auth_manager.create_authorized_http.return_value
+        mock_sheets_client.batch_read.assert_called_once_with(
+            spreadsheet_id, [sheet_range, "'Sheet1'!1:1", "'Sheet1'!2:ZZ"], http=worker_http
+        )
+        mock_sheets_client.read_range.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_extract_data_uses_first_sheet_title(self, sheets_reader, mock_sheets_client):
+        """Test that campaign ranges target the real first tab, not a hard-coded "Sheet1"."""
+        spreadsheet_id = "test_sheet_id_123"
+        mock_sheets_client.get_spreadsheet_info.return_value.sheets = [
+            {"sheet_id": 7, "title": "Q1 Media Plan", "grid_properties": {}},
+            {"sheet_id": 8, "title": "Sheet1", "grid_properties": {}}
+        ]
+        
+        result = await sheets_reader.extract_data(spreadsheet_id, "A1:D10")
+        
+        assert result["extraction_metadata"]["status"] == "success"
+        assert len(result["parsed_campaigns"]) == 2
+        worker_http = sheets_reader.auth_manager.create_authorized_http.return_value
+        mock_sheets_client.batch_read.assert_called_once_with(
+            spreadsheet_id, ["A1:D10", "'Q1 Media Plan'!1:1", "'Q1 Media Plan'!2:ZZ"], http=worker_http
+        )
+    
+    @pytest.mark.asyncio
+    async def test_extract_data_survives_unreadable_campaign_ranges(self, sheets_reader, mock_sheets_client, sample_sheet_data):
+        """Test that a failing campaign range only drops parsed campaigns, not the extraction."""
+        spreadsheet_id = "test_sheet_id_123"
+        mock_sheets_client.batch_read.side_effect = [
+            Exception("Unable to parse range: Budget!1:1"),
+            [Mock(values=sample_sheet_data["values"])]
+        ]
+        
+        result = await sheets_reader.extract_data(spreadsheet_id, "Budget!A1:E3")
+        
+        assert result["extraction_metadata"]["status"] == "success"
+        assert len(result["rows"]) == 3
+        assert result["parsed_campaigns"] == []
+        worker_http = sheets_reader.auth_manager.create_authorized_http.return_value
+        mock_sheets_client.batch_read.assert_called_with(spreadsheet_id, ["Budget!A1:E3"], http=worker_http)
+        mock_sheets_client.parse_campaign_values.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_extract_data_reuses_cached_spreadsheet_info(self, sheets_reader, mock_sheets_client):
+        """Test that repeated extracts of one spreadsheet fetch its metadata once."""
+        spreadsheet_id = "test_sheet_id_123"
+        
+        await sheets_reader.extract_data(spreadsheet_id)
+        await sheets_reader.extract_data(spreadsheet_id)
+        
+        mock_sheets_client.get_spreadsheet_info.assert_called_once_with(
+            spreadsheet_id, http=sheets_reader.auth_manager.create_authorized_http.return_value
+        )
+        
+        sheets_reader.clear_cache()
+        await sheets_reader.extract_data(spreadsheet_id)
+        
+        assert mock_sheets_client.get_spreadsheet_info.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_extracts_keep_shared_client_open(self, sheets_reader, mock_sheets_client):
+        """Test that one extract finishing doesn't release the client another is still using."""
+        results = await asyncio.gather(*(
+            sheets_reader.extract_data(spreadsheet_id) for spreadsheet_id in ("sheet_a", "sheet_b")
+        ))
+        
+        assert all(result["extraction_metadata"]["status"] == "success" for result in results)
+        mock_sheets_client.close.assert_not_called()
+        mock_sheets_client.__exit__.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_extract_data_authentication_error(self, sheets_reader):
@@ -151,7 +249,7 @@ class TestGoogleSheetsReader:
         mock_sheet_info.url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
         
         mock_sheets_client.get_spreadsheet_info.return_value = mock_sheet_info
-        mock_sheets_client.read_range.return_value = Mock(values=None)
+        mock_sheets_client.batch_read.return_value = [Mock(values=None), Mock(values=None), Mock(values=None)]
         mock_sheets_client.__enter__.return_value = mock_sheets_client
         mock_sheets_client.__exit__.return_value = None
         
@@ -182,6 +280,126 @@ class TestGoogleSheetsReader:
         assert result["extraction_metadata"]["status"] == "error"
         assert "API Error" in result["extraction_metadata"]["error_message"]
     
+    @pytest.mark.asyncio
+    async def test_extract_data_batch(self, sheets_reader, mock_sheets_client, sample_sheet_data):
+        """Test extracting several spreadsheets with one batch request."""
+        mock_sheet_info = mock_sheets_client.get_spreadsheet_info.return_value
+        mock_sheets_client.batch_read_spreadsheets.side_effect = [
+            ({}, {"sheet_a": mock_sheet_info, "sheet_b": mock_sheet_info}),
+            (
+                {
+                    "sheet_a": [
+                        Mock(values=sample_sheet_data["values"]),
+                        Mock(values=sample_sheet_data["values"][:1]),
+                        Mock(values=sample_sheet_data["values"][1:])
+                    ],
+                    "sheet_b": Exception("API Error: Sheet not found")
+                },
+                {}
+            ),
+            ({"sheet_b": Exception("API Error: Sheet not found")}, {})
+        ]
+        
+        results = await sheets_reader.extract_data_batch(["sheet_a", "sheet_b", "sheet_a"])
+        
+        assert list(results) == ["sheet_a", "sheet_b"]
+        assert results["sheet_a"]["extraction_metadata"]["status"] == "success"
+        assert results["sheet_a"]["extraction_metadata"]["campaigns_parsed"] == 2
+        assert results["sheet_b"]["extraction_metadata"]["status"] == "error"
+        assert "API Error" in results["sheet_b"]["extraction_metadata"]["error_message"]
+        
+        # Metadata goes first so the campaign ranges can name each first sheet
+        worker_http = sheets_reader.auth_manager.create_authorized_http.return_value
+        campaign_ranges = ["A1:Z1000", "'Sheet1'!1:1", "'Sheet1'!2:ZZ"]
+        assert mock_sheets_client.batch_read_spreadsheets.call_args_list == [
+            call([], [], info_ids=["sheet_a", "sheet_b"], http=worker_http),
+            call(
+                ["sheet_a", "sheet_b"],
+                {"sheet_a": campaign_ranges, "sheet_b": campaign_ranges},
+                info_ids=[],
+                http=worker_http
+            ),
+            call(["sheet_b"], ["A1:Z1000"], http=worker_http)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_extract_data_batch_isolates_sheet_titles(self, sheets_reader, mock_sheets_client, sample_sheet_data):
+        """Test that one spreadsheet's bad campaign ranges don't fail the rest of its batch."""
+        info_a = Mock(title="Plan A", url="https://docs.google.com/spreadsheets/d/sheet_a")
+        info_a.sheets = [{"sheet_id": 0, "title": "Sheet1", "grid_properties": {}}]
+        info_b = Mock(title="Plan B", url="https://docs.google.com/spreadsheets/d/sheet_b")
+        info_b.sheets = [{"sheet_id": 0, "title": "Q1 Media Plan", "grid_properties": {}}]
+        
+        mock_sheets_client.batch_read_spreadsheets.side_effect = [
+            (
+                {
+                    "sheet_a": [
+                        Mock(values=sample_sheet_data["values"]),
+                        Mock(values=sample_sheet_data["values"][:1]),
+                        Mock(values=sample_sheet_data["values"][1:])
+                    ],
+                    "sheet_b": Exception("Unable to parse range: Budget!1:1")
+                },
+                {}
+            ),
+            ({"sheet_b": [Mock(values=sample_sheet_data["values"])]}, {})
+        ]
+        sheets_reader._cache_spreadsheet_info("sheet_a", info_a)
+        sheets_reader._cache_spreadsheet_info("sheet_b", info_b)
+        
+        results = await sheets_reader.extract_data_batch(["sheet_a", "sheet_b"])
+        
+        assert results["sheet_a"]["extraction_metadata"]["campaigns_parsed"] == 2
+        assert results["sheet_b"]["extraction_metadata"]["status"] == "success"
+        assert len(results["sheet_b"]["rows"]) == 3
+        assert results["sheet_b"]["parsed_campaigns"] == []
+        
+        worker_http = sheets_reader.auth_manager.create_authorized_http.return_value
+        assert mock_sheets_client.batch_read_spreadsheets.call_args_list == [
+            call(
+                ["sheet_a", "sheet_b"],
+                {
+                    "sheet_a": ["A1:Z1000", "'Sheet1'!1:1", "'Sheet1'!2:ZZ"],
+                    "sheet_b": ["A1:Z1000", "'Q1 Media Plan'!1:1", "'Q1 Media Plan'!2:ZZ"]
+                },
+                info_ids=[],
+                http=worker_http
+            ),
+            call(["sheet_b"], ["A1:Z1000"], http=worker_http)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_discovery_seeds_spreadsheet_info_cache(self, sheets_reader, mock_sheets_client, sample_sheet_data):
+        """Test that extracting discovered sheets skips the metadata-only batch."""
+        mock_sheet_info = mock_sheets_client.get_spreadsheet_info.return_value
+        mock_sheet_info.spreadsheet_id = "sheet_a"
+        mock_sheet_info.modified_time = None
+        mock_sheets_client.find_campaign_sheets_async = AsyncMock(return_value=[mock_sheet_info])
+        mock_sheets_client.batch_read_spreadsheets.return_value = (
+            {
+                "sheet_a": [
+                    Mock(values=sample_sheet_data["values"]),
+                    Mock(values=sample_sheet_data["values"][:1]),
+                    Mock(values=sample_sheet_data["values"][1:])
+                ]
+            },
+            {}
+        )
+        mock_drive_client = MagicMock(spec=GoogleDriveClient)
+        mock_drive_client.__enter__.return_value = mock_drive_client
+        sheets_reader._drive_client = mock_drive_client
+        
+        await sheets_reader.discover_campaign_sheets()
+        results = await sheets_reader.extract_data_batch(["sheet_a"])
+        
+        assert results["sheet_a"]["extraction_metadata"]["campaigns_parsed"] == 2
+        mock_sheets_client.batch_read_spreadsheets.assert_called_once_with(
+            ["sheet_a"],
+            {"sheet_a": ["A1:Z1000", "'Sheet1'!1:1", "'Sheet1'!2:ZZ"]},
+            info_ids=[],
+            http=sheets_reader.auth_manager.create_authorized_http.return_value
+        )
+    
     @pytest.mark.asyncio
     async def test_discover_campaign_sheets(self, sheets_reader):
         """Test discovering campaign-related spreadsheets."""
@@ -203,7 +421,7 @@ class TestGoogleSheetsReader:
         
         mock_sheets_client = Mock(spec=GoogleSheetsClient)
         mock_drive_client = Mock(spec=GoogleDriveClient)
-        mock_sheets_client.find_campaign_sheets.return_value = mock_sheet_infos
+        mock_sheets_client.find_campaign_sheets_async.return_value = mock_sheet_infos
         mock_sheets_client.__enter__.return_value = mock_sheets_client
         mock_sheets_client.__exit__.return_value = None
         mock_drive_client.__enter__.return_value = mock_drive_client
@@ -222,6 +440,7 @@ class TestGoogleSheetsReader:
         sheet = result["discovered_sheets"][0]
         assert sheet["spreadsheet_id"] == "sheet1"
         assert sheet["title"] == "Campaign Q1 2024"
+        assert sheet["mime_type"] == "application/vnd.google-apps.spreadsheet"
         assert "Campaign Data" in sheet["sheets"]
 
 
@@ -320,6 +539,38 @@ class TestFileParser:
         assert result["file_type"] == "google_drive"
         file_parser.parse_google_drive_file.assert_called_once_with(file_id)
     
+    @pytest.mark.asyncio
+    async def test_parse_files_fetches_each_spreadsheet_once(self, file_parser):
+        """Test bulk parsing reuses results for paths pointing at the same spreadsheet."""
+        spreadsheet_id = "1a2b3c4d5e6f7g8h9i0j1k2l3m4n5o6p"
+        sheets_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit"
+        other_url = "https://docs.google.com/spreadsheets/d/xyz789/edit"
+        
+        sheet_data = {
+            "headers": ["Campaign", "Budget"],
+            "parsed_campaigns": [],
+            "extraction_metadata": {"status": "success"}
+        }
+        
+        mock_sheets_reader = Mock()
+        mock_sheets_reader.extract_data_batch = AsyncMock(
+            side_effect=lambda spreadsheet_ids, **kwargs: {i: sheet_data for i in spreadsheet_ids}
+        )
+        file_parser._sheets_reader = mock_sheets_reader
+        
+        file_paths = [sheets_url, other_url, spreadsheet_id, "report.csv", sheets_url]
+        results = await file_parser.parse_files(file_paths)
+        
+        assert set(results) == set(file_paths)
+        assert results[sheets_url]["file_id"] == spreadsheet_id
+        assert results[spreadsheet_id] is results[sheets_url]
+        assert results[other_url]["file_id"] == "xyz789"
+        assert results["report.csv"]["parsing_status"] == "not_implemented"
+        # Every Sheets URL is read in one batch
+        mock_sheets_reader.extract_data_batch.assert_awaited_once_with(
+            [spreadsheet_id, "xyz789"], include_raw_rows=False
+        )
+    
     def test_url_detection_methods(self, file_parser):
         """Test URL and ID detection methods."""
         # Test Google Drive ID detection
@@ -458,6 +709,38 @@ class TestDataValidator:
         assert result["is_valid"] is False
         assert any("campaign_name" in error.lower() for error in result["errors"])
     
+    @pytest.mark.asyncio
+    async def test_validate_campaign_data_platform_normalization(self, data_validator):
+        """Test that platform names match regardless of case and surrounding spaces."""
+        campaign_data = {
+            "parsed_campaigns": [
+                {"campaign_name": "Lowercase", "budget": 10000, "platform": "google ads"},
+                {"campaign_name": "Padded", "budget": 10000, "platform": " Meta Ads "},
+                {"campaign_name": "Unknown", "budget": 10000, "platform": "TikTok Ads"}
+            ]
+        }
+        
+        result = await data_validator.validate_campaign_data(campaign_data)
+        
+        platform_warnings = [w for w in result["warnings"] if "Platform" in w]
+        assert len(platform_warnings) == 1
+        assert "TikTok Ads" in platform_warnings[0]
+    
+    @pytest.mark.asyncio
+    async def test_validate_campaign_data_non_string_platform(self, data_validator):
+        """Test that an unhashable platform value is reported, not raised."""
+        campaign_data = {
+            "parsed_campaigns": [
+                {"campaign_name": "Multi", "budget": 10000, "platform": ["Google Ads", "Meta Ads"]}
+            ]
+        }
+        
+        result = await data_validator.validate_campaign_data(campaign_data)
+        
+        platform_warnings = [w for w in result["warnings"] if "Platform" in w]
+        assert len(platform_warnings) == 1
+        assert "['Google Ads', 'Meta Ads']" in platform_warnings[0]
+    
     @pytest.mark.asyncio
     async def test_data_quality_scoring(self, data_validator, sample_sheet_data):
         """Test data quality scoring algorithm."""
@@ -479,6 +762,34 @@ class TestDataValidator:
         assert high_quality_score > low_quality_score
         assert 0.0 <= low_quality_score <= 1.0
         assert 0.0 <= high_quality_score <= 1.0
+    
+    @pytest.mark.asyncio
+    async def test_validate_extracted_sheet_data_stop_early(self, data_validator, sample_sheet_data):
+        """Test that validation stops once the quality threshold is unreachable."""
+        invalid_campaign = {"campaign_name": "", "budget": None, "platform": ""}
+        sample_sheet_data["parsed_campaigns"] = [invalid_campaign] * 8 + sample_sheet_data["parsed_campaigns"] * 2
+        
+        full_result = await data_validator.validate_extracted_sheet_data(sample_sheet_data)
+        result = await data_validator.validate_extracted_sheet_data(sample_sheet_data, stop_early=True)
+        
+        assert result["is_valid"] is full_result["is_valid"] is False
+        assert result["validation_metadata"]["early_exited"] is True
+        assert "early_exited" not in full_result["validation_metadata"]
+        assert len(result["warnings"]) < len(full_result["warnings"])
+    
+    @pytest.mark.asyncio
+    async def test_validate_sheet_data_streaming(self, data_validator):
+        """Test that legacy sheet validation consumes rows from an iterator."""
+        headers = ["Campaign", "Budget"]
+        rows = [headers, ["Summer Sale", "50000"], ["Winter Promo", ""], ["Spring Launch"]]
+        
+        result = await data_validator.validate_sheet_data_streaming(headers, (row for row in rows))
+        legacy_result = await data_validator.validate_sheet_data({"headers": headers, "rows": rows})
+        
+        assert result["is_valid"] is True
+        assert result["warnings"] == ["Empty budget value in row 3", "Empty budget value in row 4"]
+        assert result["validation_metadata"]["rows_validated"] == 4
+        assert legacy_result["warnings"] == result["warnings"]
 
 
 class TestWorkspaceManager:
@@ -570,6 +881,116 @@ class TestWorkspaceManager:
         assert "file_validations" in result
         assert len(result["file_validations"]) == len(discovered_files)
     
+    @pytest.mark.asyncio
+    async def test_validate_workspace_batches_extraction(self, workspace_manager):
+        """Test that spreadsheets are extracted in one batch and reported in input order."""
+        spreadsheet_mime = "application/vnd.google-apps.spreadsheet"
+        discovered_files = [
+            {"spreadsheet_id": "slow_sheet", "title": "Slow", "mime_type": spreadsheet_mime},
+            {"spreadsheet_id": "doc", "title": "Notes", "mime_type": "application/vnd.google-apps.document"},
+            {"spreadsheet_id": "fast_sheet", "title": "Fast", "mime_type": spreadsheet_mime}
+        ]
+        
+        mock_sheets_reader = Mock()
+        mock_sheets_reader.extract_data_batch = AsyncMock(return_value={
+            "fast_sheet": {"spreadsheet_id": "fast_sheet"},
+            "slow_sheet": {"spreadsheet_id": "slow_sheet"}
+        })
+        workspace_manager._sheets_reader = mock_sheets_reader
+        
+        mock_data_validator = Mock()
+        mock_data_validator.validate_data = AsyncMock(
+            side_effect=lambda sheet_data, validation_type: {
+                "is_valid": sheet_data["spreadsheet_id"] == "slow_sheet"
+            }
+        )
+        workspace_manager._data_validator = mock_data_validator
+        
+        result = await workspace_manager.validate_workspace(discovered_files)
+        
+        assert [r["file_info"]["title"] for r in result["validation_results"]] == ["Slow", "Fast"]
+        assert result["overall_valid"] is False
+        assert result["operation_metadata"]["files_passed"] == 1
+        mock_sheets_reader.extract_data_batch.assert_called_once_with(
+            ["slow_sheet", "fast_sheet"], max_concurrency=8
+        )
+    
+    @pytest.mark.asyncio
+    async def test_validate_workspace_fail_fast(self, workspace_manager):
+        """Test that fail_fast stops validating after the first invalid file."""
+        spreadsheet_mime = "application/vnd.google-apps.spreadsheet"
+        discovered_files = [
+            {"spreadsheet_id": sheet_id, "title": sheet_id, "mime_type": spreadsheet_mime}
+            for sheet_id in ["good_sheet", "bad_sheet", "other_sheet"]
+        ]
+        
+        mock_sheets_reader = Mock()
+        mock_sheets_reader.extract_data_batch = AsyncMock(
+            side_effect=lambda spreadsheet_ids, max_concurrency: {
+                sheet_id: {"spreadsheet_id": sheet_id} for sheet_id in spreadsheet_ids
+            }
+        )
+        workspace_manager._sheets_reader = mock_sheets_reader
+        
+        mock_data_validator = Mock()
+        mock_data_validator.validate_data = AsyncMock(
+            side_effect=lambda sheet_data, validation_type: {
+                "is_valid": sheet_data["spreadsheet_id"] != "bad_sheet"
+            }
+        )
+        workspace_manager._data_validator = mock_data_validator
+        
+        result = await workspace_manager.validate_workspace(discovered_files, fail_fast=True)
+        
+        assert result["overall_valid"] is False
+        assert [r["file_info"]["title"] for r in result["validation_results"]] == ["good_sheet", "bad_sheet"]
+        assert result["operation_metadata"]["stopped_early"] is True
+        assert mock_data_validator.validate_data.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_validate_workspace_caches_unchanged_sheets(self, workspace_manager):
+        """Test that unchanged spreadsheets reuse their earlier validation result."""
+        file_info = {
+            "spreadsheet_id": "sheet1",
+            "title": "Campaign Q1 2024",
+            "mime_type": "application/vnd.google-apps.spreadsheet",
+            "modified_time": "2024-01-01T00:00:00"
+        }
+        
+        mock_sheets_reader = Mock()
+        mock_sheets_reader.extract_data_batch = AsyncMock(return_value={
+            "sheet1": {"spreadsheet_id": "sheet1", "extraction_metadata": {"status": "success"}}
+        })
+        workspace_manager._sheets_reader = mock_sheets_reader
+        
+        mock_data_validator = Mock()
+        mock_data_validator.validate_data = AsyncMock(
+            side_effect=lambda sheet_data, validation_type: {"is_valid": True, "warnings": []}
+        )
+        workspace_manager._data_validator = mock_data_validator
+        
+        first = await workspace_manager.validate_workspace([file_info])
+        second = await workspace_manager.validate_workspace([file_info])
+        
+        assert first["validation_results"] == second["validation_results"]
+        mock_sheets_reader.extract_data_batch.assert_called_once()
+        mock_data_validator.validate_data.assert_called_once()
+        
+        # Results handed out don't share state with the cache or each other
+        renamed_file = {**file_info, "title": "Renamed"}
+        second["validation_results"][0]["warnings"].append("changed by caller")
+        third = await workspace_manager.validate_workspace([renamed_file])
+        
+        assert third["validation_results"][0]["warnings"] == []
+        assert third["validation_results"][0]["file_info"] is renamed_file
+        assert first["validation_results"][0]["file_info"] is file_info
+        
+        # A newer revision is extracted and validated again
+        await workspace_manager.validate_workspace([{**file_info, "modified_time": "2024-02-01T00:00:00"}])
+        
+        assert mock_sheets_reader.extract_data_batch.call_count == 2
+        assert mock_data_validator.validate_data.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_execute_operation_discovery(self, workspace_manager):
         """Test executing discovery operations."""